@@ -2,11 +2,13 @@
 # -*- coding: utf-8 -*-
 
 import os
-import swisseph as swe
+import threading
+import engine
+import render
 import tkinter as tk
-from math import cos, sin, radians
+from concurrent.futures import ThreadPoolExecutor
 
-swe.set_ephe_path(os.path.join(os.getcwd(), "Eph"))
+engine.set_ephe_path()
 
 root = tk.Tk()
 root.title("")
@@ -25,6 +27,14 @@ if os.name == "nt":
 
 canvas = None
 toplevel = None
+chart = None
+job = None
+animation = None
+step_unit = None
+executor = ThreadPoolExecutor(max_workers=1)
+POLL_INTERVAL = 20
+FRAME_INTERVAL = 40
+STEPS = {"Minute": 1 / 1440, "Hour": 1 / 24, "Day": 1}
 
 
 def create_toplevel():
@@ -43,11 +53,34 @@ def create_canvas(master):
     global canvas
     if canvas is not None:
         canvas.destroy()
-    canvas = tk.Canvas(master=master, bg="white", width=1270, height=660)
+    canvas = tk.Canvas(master=master, bg="white", width=render.WIDTH, height=render.HEIGHT)
     canvas.grid(row=0, column=0)
     return canvas
 
 
+def create_controls(master):
+    global step_unit
+    frame = tk.Frame(master=master, bg="white")
+    frame.grid(row=1, column=0, pady=5)
+    step_unit = tk.StringVar(master=master)
+    step_unit.set("Hour")
+    menu = tk.OptionMenu(frame, step_unit, *STEPS)
+    menu.configure(bg="white", activebackground="white")
+    menu.grid(row=0, column=0, padx=5)
+    controls = [
+        ("\u25C0\u25C0", lambda: play_chart(-1)),
+        ("\u25C0", lambda: step_chart(-1)),
+        ("\u25A0", stop_animation),
+        ("\u25B6", lambda: step_chart(1)),
+        ("\u25B6\u25B6", lambda: play_chart(1))
+    ]
+    for i, (text, command) in enumerate(controls):
+        control = tk.Button(master=frame, text=text, bg="white", activeforeground="black",
+                            activebackground="white", command=command)
+        control.grid(row=0, column=i + 1, padx=2)
+    return frame
+
+
 def create_label(*args, column, padx=1, bg="white", fg="black", row=0, columnspan=1):
     for i, j in enumerate(args):
         label = tk.Label(master=root, text=j, bg=bg, fg=fg)
@@ -62,40 +95,17 @@ def create_entry(n, column, row=0, columnspan=1):
         yield entry
 
 
-label_names = "Year", "Month", "Day", "Hour", "Minute", "Latitude", "Longitude"
+label_names = "Year", "Month", "Day", "Hour", "Minute", "Latitude", "Longitude", "Zone"
 entry_label = {
     i: [j, k] for i, j, k in zip(
-        label_names, create_entry(n=7, column=1, row=3), create_label(*label_names, column=0, row=3))
+        label_names, create_entry(n=8, column=1, row=3), create_label(*label_names, column=0, row=3))
 }
+# An empty zone is looked up from the location.
+entry_label["Zone"][0].configure(width=18)
 
-PLANETS = {
-    "Sun": swe.SUN,
-    "Moon": swe.MOON,
-    "Mercury": swe.MERCURY,
-    "Venus": swe.VENUS,
-    "Mars": swe.MARS,
-    "Jupiter": swe.JUPITER,
-    "Saturn": swe.SATURN,
-    "Uranus": swe.URANUS,
-    "Neptune": swe.NEPTUNE,
-    "Pluto": swe.PLUTO,
-    "North Node": swe.TRUE_NODE,
-    "Chiron": swe.CHIRON
-}
+PLANETS = engine.PLANETS
 
-ASPECT_SYMBOLS = {
-    "Conjunction": "\u260C",
-    "Semi-Sextile": "\u26BA",
-    "Semi-Square": "\u2220",
-    "Sextile": "\u26B9",
-    "Quintile": "Q",
-    "Square": "\u25A1",
-    "Trine": "\u25B3",
-    "Sesquiquadrate": "\u26BC",
-    "BiQuintile": "bQ",
-    "Quincunx": "\u26BB",
-    "Opposite": "\u260D",
-}
+ASPECT_SYMBOLS = render.ASPECT_SYMBOLS
 
 ENABLED_ASPECTS = {}
 MIDPOINT = {}
@@ -149,6 +159,8 @@ def extend_aspect_checkbutton():
             labels.pop(i)
             entries.pop(i)
             break
+    if chart is not None and toplevel.winfo_exists():
+        chart.refresh()
 
 
 def extend_midpoint_checkbutton():
@@ -176,875 +188,123 @@ for i in ASPECT_SYMBOLS.items():
     ENABLED_ASPECTS[i[0]][0].configure(command=extend_aspect_checkbutton)
 
 
-def oval_object(x, y, r, dash=True):
-    if dash is True:
-        dash = (1, 10)
-        canvas.create_oval(
-            x - r,
-            y - r,
-            x + r,
-            y + r,
-            fill="white",
-            width=2,
-            dash=dash
-        )
-    else:
-        canvas.create_oval(
-            x - r,
-            y - r,
-            x + r,
-            y + r,
-            fill="white",
-            width=2,
-        )
-
-
-def line_object(x1, y1, x2, y2, width=2, fill="black"):
-    canvas.create_line(x1, y1, x2, y2, width=width, fill=fill)
-
-
-def text_object(x, y, _text, width=0, font="Arial", fill="black"):
-    canvas.create_text(x, y, text=_text, width=width, font=font, fill=fill)
-
-
-class Chart:
-    def __init__(self, year, month, day, hour, minute, longitude, latitude):
-        self.year = year
-        self.month = month
-        self.day = day
-        if DAY_LIGHT_SAVE_TIME["DST (on/off)"][1].get() == "1":
-            self.hour = hour - 1
-        else:
-            self.hour = hour
-        self.minute = minute
-        self.longitude = longitude
-        self.latitude = latitude
-        self.calender_variables = {"Julian": [self.year, self.month, self.day]}
-        self.julian_to_gregorian(0, 3, 3, 100, 3, 1, -2)
-        self.julian_to_gregorian(100, 3, 2, 200, 2, 29, -1)
-        self.julian_to_gregorian(200, 3, 1, 300, 2, 28, 0)
-        self.julian_to_gregorian(300, 2, 29, 500, 2, 27, 1)
-        self.julian_to_gregorian(500, 2, 28, 600, 2, 26, 2)
-        self.julian_to_gregorian(600, 2, 27, 700, 2, 25, 3)
-        self.julian_to_gregorian(700, 2, 26, 900, 2, 24, 4)
-        self.julian_to_gregorian(900, 2, 25, 1000, 2, 23, 5)
-        self.julian_to_gregorian(1000, 2, 24, 1100, 2, 22, 6)
-        self.julian_to_gregorian(1100, 2, 23, 1300, 2, 21, 7)
-        self.julian_to_gregorian(1300, 2, 22, 1400, 2, 20, 8)
-        self.julian_to_gregorian(1400, 2, 21, 1500, 2, 19, 9)
-        self.julian_to_gregorian(1500, 2, 20, 1582, 10, 4, 10)
-        self.calender_variables["Gregorian"] = [self.year, self.month, self.day]
-        self.SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-                      "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        self.SIGN_SYMBOLS = ["\u2648", "\u2649", "\u264A", "\u264B", "\u264C", "\u264D",
-                             "\u264E", "\u264F", "\u2650", "\u2651", "\u2652", "\u2653"]
-        self.SIGN_COLORS = ["red", "green", "yellow", "blue"] * 3
-        self._SIGN_SYMBOLS = {i: j for i, j in zip(self.SIGNS, self.SIGN_SYMBOLS)}
-        self._SIGN_COLORS = {i: j for i, j in zip(self.SIGNS, self.SIGN_COLORS)}
-        self.PLANETS = {i: j for i, j in PLANETS.items()}
-        self.PLANET_SYMBOLS = {
-            "Sun": "\u2299",
-            "Moon": "\u263E",
-            "Mercury": "\u263F",
-            "Venus": "\u2640",
-            "Mars": "\u2642",
-            "Jupiter": "\u2643",
-            "Saturn": "\u2644",
-            "Uranus": "\u2645",
-            "Neptune": "\u2646",
-            "Pluto": "\u2647",
-            "North Node": "\u260A",
-            "Chiron": "\u26B7"
-        }
-        self.ASPECT_SYMBOLS = ASPECT_SYMBOLS
-        self.ASPECT_SYMBOLS["Null"] = " "
-        self.ASPECTS = {i: [] for i in self.PLANETS.keys()}
-        self.MIDPOINTS = {}
-        self.ORB_FACTORS = {}
-        self.CONJUNCTION = []
-        self.SEMI_SEXTILE = []
-        self.SEMI_SQUARE = []
-        self.SEXTILE = []
-        self.QUINTILE = []
-        self.SQUARE = []
-        self.TRINE = []
-        self.SESQUIQUADRATE = []
-        self.BIQUINTILE = []
-        self.QUINCUNX = []
-        self.OPPOSITE = []
-        self.NULL = []
-        self.PLANET_DEGREES = []
-        self.MIDPOINT_OF_HOUSES = []
-        self.PLANET_INFO_FORMAT = []
-        self.HOUSE_INFO_FORMAT = []
-        self.draw_oval_object()
-        self.draw_line_object()
-        self.draw_houses()
-        self.draw_signs()
-        self.draw_house_numbers()
-        self.draw_sign_symbols()
-        self.draw_planets()
-        self.draw_aspects()
-        self.parse_aspects()
-        self.new_order_of_the_aspects()
-        self.draw_house_info()
-        self.draw_planet_info()
-        self.draw_aspect_info()
-        self.draw_chart_info()
-        self.draw_midpoints()
-
-    @staticmethod
-    def dd_to_dms(dd):
-        degree = int(dd)
-        minute = int((dd - degree) * 60)
-        second = round(float((dd - degree - minute / 60) * 3600))
-        return f"{degree}\u00b0 {minute}\' {second}\""
-
-    @staticmethod
-    def dms_to_dd(dms):
-        dms = dms.replace("\u00b0", "").replace("\'", "").replace("\"", "")
-        degree = int(dms.split(" ")[0])
-        minute = float(dms.split(" ")[1]) / 60
-        second = float(dms.split(" ")[2]) / 3600
-        return degree + minute + second
-
-    def julian_to_gregorian(self, year1, month1, day1, year2, month2, day2, count):
-        def if_self_month_equals_to_13():
-            if self.month == 13:
-                self.year += 1
-                self.month -= 12
-
-        if self.year == year1:
-            if self.month == month1:
-                if self.day > day1:
-                    self.day += count
-                    if self.day > 29:
-                        self.day -= 29
-                        self.month += 1
-            elif self.month > month1:
-                self.day += count
-                if self.month % 2 != 0 or self.month == 8:
-                    if self.day > 31:
-                        self.day -= 31
-                        self.month += 1
-                elif self.month % 2 == 0 and self.month != 8:
-                    if self.day > 30:
-                        self.day -= 30
-                        self.month += 1
-                        if_self_month_equals_to_13()
-        elif year1 < self.year < year2:
-            self.day += count
-            if self.month == 2:
-                if self.year % 4 == 0:
-                    if self.day > 29:
-                        self.day -= 29
-                        self.month += 1
-                elif self.year % 4 != 0:
-                    if self.day > 28:
-                        self.day -= 28
-                        self.month += 1
-            elif self.month % 2 != 0 or self.month == 8:
-                if self.day > 31:
-                    self.day -= 31
-                    self.month += 1
-            elif self.month % 2 == 0 and self.month != 8 and self.month != 2:
-                if self.day > 30:
-                    self.day -= 30
-                    self.month += 1
-                    if_self_month_equals_to_13()
-        elif self.year == year2:
-            if self.month == month2:
-                if self.day > day2:
-                    self.day += count
-                    if self.day > 30:
-                        self.day -= 30
-                        self.month += 1
-            elif self.month < month2:
-                self.day += count
-                if self.month == 2:
-                    if self.day > 29:
-                        self.day -= 29
-                        self.month += 1
-                elif self.month % 2 != 0 or self.month == 8:
-                    if self.day > 31:
-                        self.day -= 31
-                        self.month += 1
-                elif self.month % 2 == 0 and self.month != 8 and self.month != 2:
-                    if self.day > 30:
-                        self.day -= 30
-                        self.month += 1
-                        if_self_month_equals_to_13()
-
-    def utc_time(self):
-        longitude = int(self.longitude)
-        hour = float(self.hour)
-        if longitude == 0:
-            return hour
-        elif longitude in range(1, 16):
-            return hour - 1
-        elif longitude in range(-16, -1):
-            return hour + 1
-        elif longitude in range(16, 31):
-            return hour - 2
-        elif longitude in range(-31, -16):
-            return hour + 2
-        elif longitude in range(31, 46):
-            return hour - 3
-        elif longitude in range(-46, -31):
-            return hour + 3
-        elif longitude in range(46, 61):
-            return hour - 4
-        elif longitude in range(-61, -46):
-            return hour + 4
-        elif longitude in range(61, 76):
-            return hour - 5
-        elif longitude in range(-76, -61):
-            return hour + 5
-        elif longitude in range(76, 91):
-            return hour - 6
-        elif longitude in range(-91, -76):
-            return hour + 6
-        elif longitude in range(91, 106):
-            return hour - 7
-        elif longitude in range(-106, -91):
-            return hour + 7
-        elif longitude in range(106, 121):
-            return hour - 8
-        elif longitude in range(-121, -106):
-            return hour + 8
-        elif longitude in range(121, 136):
-            return hour - 9
-        elif longitude in range(-136, -121):
-            return hour + 9
-        elif longitude in range(136, 151):
-            return hour - 10
-        elif longitude in range(-151, -136):
-            return hour + 10
-        elif longitude in range(151, 166):
-            return hour - 11
-        elif longitude in range(-166, -151):
-            return hour + 11
-        elif longitude in range(166, 181):
-            return hour - 12
-        elif longitude in range(-181, -166):
-            return hour + 12
-
-    def julday(self):
-        jd = swe.julday(
-            self.year, self.month, self.day, self.utc_time() + self.minute / 60)
-        deltat = swe.deltat(jd)
-        return round(jd + deltat, 6)
-
-    @staticmethod
-    def convert_angle(angle):
-        if 0 < angle < 30:
-            return angle, "Aries"
-        elif 30 < angle < 60:
-            return angle - 30, "Taurus"
-        elif 60 < angle < 90:
-            return angle - 60, "Gemini"
-        elif 90 < angle < 120:
-            return angle - 90, "Cancer"
-        elif 120 < angle < 150:
-            return angle - 120, "Leo"
-        elif 150 < angle < 180:
-            return angle - 150, "Virgo"
-        elif 180 < angle < 210:
-            return angle - 180, "Libra"
-        elif 210 < angle < 240:
-            return angle - 210, "Scorpio"
-        elif 240 < angle < 270:
-            return angle - 240, "Sagittarius"
-        elif 270 < angle < 300:
-            return angle - 270, "Capricorn"
-        elif 300 < angle < 330:
-            return angle - 300, "Aquarius"
-        elif 330 < angle < 360:
-            return angle - 330, "Pisces"
-
-    def planet_pos(self, planet):
-        calc = self.convert_angle(swe.calc_ut(self.julday(), planet)[0])
-        return self.dd_to_dms(calc[0]), calc[1]
-
-    def append_house(self, house, i, j, name=""):
-        if name == "":
-            house.append((
-                f"House {i + 1}",
-                f"{self.dd_to_dms(self.convert_angle(j)[0])}",
-                f"{self.convert_angle(j)[1]}"))
-        else:
-            house.append((
-                f"{name}",
-                f"{self.dd_to_dms(self.convert_angle(j)[0])}",
-                f"{self.convert_angle(j)[1]}"))
-
-    def house_cusps(self):
-        houses = []
-        asc = 0
-        angle = []
-        for i, j in enumerate(swe.houses(self.julday(), self.latitude, self.longitude)[0]):
-            if i == 0:
-                asc += j
-            angle.append(j)
-            if i + 1 == 1:
-                self.append_house(houses, i, j, name="Asc")
-            elif i + 1 == 4:
-                self.append_house(houses, i, j, name="IC")
-            elif i + 1 == 7:
-                self.append_house(houses, i, j, name="Dsc")
-            elif i + 1 == 10:
-                self.append_house(houses, i, j, name="MC")
-            else:
-                self.append_house(houses, i, j)
-        return houses, asc, angle
-
-    def house_pos(self):
-        return self.house_cusps()[2]
-
-    def sign_pos(self):
-        asc = self.house_cusps()[1]
-        degree = self.house_cusps()[0][0][1].replace("'", "").replace('"', "").replace("\u00b0", "")
-        end = 30 - self.dms_to_dd(degree) + asc
-        start = end - 30
-        signs = []
-        for i, j in enumerate(self.house_cusps()[0]):
-            signs.append(j[2])
-        for i in self.SIGNS:
-            if i not in signs:
-                index_1 = self.SIGNS.index(i) + 1
-                sign = self.SIGNS[index_1]
-                index_2 = signs.index(sign)
-                signs.insert(index_2, i)
-        for i in signs:
-            count = signs.count(i)
-            if count > 1:
-                signs.pop(signs.index(i, 1))
-        _signs_ = []
-        for i, j in enumerate(signs):
-            _start = start + (i * 30)
-            _end = end + (i * 30)
-            if _start > 360:
-                _start -= 360
-            if _end > 360:
-                _end -= 360
-            _signs_.append(_start)
-        return _signs_, signs
-
-    @staticmethod
-    def line_components(angle, r):
-        x1, y1 = 550, 350
-        x2 = x1 + (r * cos(radians(angle)))
-        y2 = y1 - (r * sin(radians(angle)))
-        return x1, y1, x2, y2
-
-    def x_y(self, angle, r1, r2):
-        x1, y1, x2, y2 = self.line_components(angle=angle, r=r1)
-        _x1, _y1, _x2, _y2 = self.line_components(angle=angle, r=r2)
-        return x2, y2, _x2, _y2
-
-    @staticmethod
-    def draw_oval_object(x=550, y=350):
-        oval_object(x=x, y=y, r=260, dash=False)
-        oval_object(x=x, y=y, r=210, dash=False)
-        oval_object(x=x, y=y, r=165)
-        oval_object(x=x, y=y, r=60, dash=False)
-
-    @staticmethod
-    def draw_line_object(x=900, y=1200):
-        line_object(x1=x, y1=205, x2=y, y2=205, width=1)
-        line_object(x1=x, y1=410, x2=y, y2=410, width=1)
-        line_object(x1=x, y1=428, x2=x, y2=624, width=1)
-        line_object(x1=x, y1=428 + (13 * 15), x2=x + 25 + (20 * 15), y2=428 + (13 * 15), width=1)
-
-    def draw_houses(self):
-        for i, j in enumerate(self.house_pos()):
-            _degree = j - (self.house_pos()[0] - 180)
-            if _degree < 0:
-                _degree += 360
-            elif _degree > 360:
-                _degree -= 360
-            self.MIDPOINT_OF_HOUSES.append(_degree)
-            x1, y1, x2, y2 = self.x_y(angle=_degree, r1=60, r2=210)
-            if i == 0 or i == 3 or i == 6 or i == 9:
-                line_object(x1, y1, x2, y2, width=4)
-            else:
-                line_object(x1, y1, x2, y2, width=2)
-
-    def draw_signs(self):
-        sign_pos = self.sign_pos()[0]
-        for i in sign_pos:
-            _degree = i - (self.house_pos()[0] - sign_pos[1])
-            if _degree > 360:
-                _degree -= 360
-            x1, y1, x2, y2 = self.x_y(angle=_degree, r1=210, r2=260)
-            line_object(x1, y1, x2, y2, width=2)
-
-    def draw_house_numbers(self):
-        for i, j in enumerate(self.MIDPOINT_OF_HOUSES):
-            if i == 11:
-                midpoint = (self.MIDPOINT_OF_HOUSES[i] + self.MIDPOINT_OF_HOUSES[0]) / 2
-            else:
-                if self.MIDPOINT_OF_HOUSES[i] == 360:
-                    midpoint = self.MIDPOINT_OF_HOUSES[i + 1] / 2
-                else:
-                    if self.MIDPOINT_OF_HOUSES[i + 1] == 0 or self.MIDPOINT_OF_HOUSES[i + 1] < 30:
-                        midpoint = (self.MIDPOINT_OF_HOUSES[i] + self.MIDPOINT_OF_HOUSES[i + 1] + 360) / 2
-                    else:
-                        midpoint = (self.MIDPOINT_OF_HOUSES[i] + self.MIDPOINT_OF_HOUSES[i + 1]) / 2
-            x1, y1, x2, y2 = self.x_y(angle=midpoint, r1=60, r2=110)
-            x = (x1 + x2) / 2
-            y = (y1 + y2) / 2
-            text_object(x=x, y=y, _text=f"{i + 1}")
-
-    def draw_sign_symbols(self):
-        asc = self.house_cusps()[1]
-        for i, j in enumerate(self.SIGNS):
-            end = 30 - (asc % 30) + 180
-            start = end - 30
-            start += (30 * i)
-            end += (30 * i)
-            if start > 360:
-                start -= 360
-            if end > 360:
-                end -= 360
-            if start > 330:
-                midpoint = (start + end + 360) / 2
-            else:
-                midpoint = (start + end) / 2
-            if midpoint > 360:
-                midpoint -= 360
-            x1, y1, x2, y2 = self.x_y(angle=midpoint, r1=210, r2=260)
-            x = (x1 + x2) / 2
-            y = (y1 + y2) / 2
-            text_object(x=x, y=y, _text=self._SIGN_SYMBOLS[self.sign_pos()[1][i]],
-                        font="Arial 25", fill=self._SIGN_COLORS[self.sign_pos()[1][i]])
-
-    def modify_text_object(self, planet_symbol, key, value, offset):
-        x1, y1, x2, y2 = self.x_y(angle=value, r1=210, r2=175)
-        x = ((x1 + x2) / 2) + offset
-        y = ((y1 + y2) / 2) + offset
-        if key == "Mars" or key == "Venus":
-            if os.name == "posix":
-                text_object(x=x, y=y, _text=f"{planet_symbol}", width=0, font="Arial 30")
-            elif os.name == "nt":
-                text_object(x=x, y=y, _text=f"{planet_symbol}", width=0, font="Arial 20")
-        else:
-            text_object(x=x, y=y, _text=f"{planet_symbol}", width=0, font="Arial 20")
-
-    def draw_planets(self):
-        count = 0
-        planet_info_format = []
-        house_info_format = []
-        for key, value in self.PLANETS.items():
-            planet = self.planet_pos(value)
-            split_degree_1 = planet[0].split(" ")
-            degree_1, minute_1, second_1 = split_degree_1
-            planet_info = (
-                self.PLANET_SYMBOLS[key],
-                key,
-                degree_1,
-                minute_1,
-                second_1,
-                self._SIGN_SYMBOLS[planet[1]],
-                planet[1]
-            )
-            planet_info_format.append(planet_info)
-            split_degree_2 = self.house_cusps()[0][count][1].split(" ")
-            degree_2, minute_2, second_2 = split_degree_2
-            house_info = [
-                self.house_cusps()[0][count][0],
-                degree_2,
-                minute_2,
-                second_2,
-                self._SIGN_SYMBOLS[self.house_cusps()[0][count][-1]],
-                self.house_cusps()[0][count][-1]
-            ]
-            house_info_format.append(house_info)
-            count += 1
-            convert_planet_degree = self.dms_to_dd(
-                self.planet_pos(value)[0].replace("'", "").replace('"', "").replace("\u00b0", ""))
-            asc = self.house_cusps()[1]
-            signs = []
-            for i, j in enumerate(self.SIGNS):
-                end = 30 - (asc % 30) + 180
-                start = end - 30
-                start += (30 * i)
-                end += (30 * i)
-                if start > 360:
-                    start -= 360
-                if end > 360:
-                    end -= 360
-                signs.append(start)
-            planet_index = self.sign_pos()[1].index(planet[1])
-            new_degree_of_planet = convert_planet_degree + signs[planet_index]
-            self.PLANET_DEGREES.append(new_degree_of_planet)
-        self.PLANET_INFO_FORMAT = planet_info_format
-        self.HOUSE_INFO_FORMAT = house_info_format
-        count1 = 0
-        count2 = 0
-        for i, j in zip(["Ascendant", "Medium Coeli"], ["Asc", "Mc"]):
-            self.PLANETS[i] = 16 + count1
-            self.PLANET_SYMBOLS[i] = j
-            self.PLANET_DEGREES.append(self.MIDPOINT_OF_HOUSES[count2])
-            count1 += 3
-            count2 += 9
-        planet_degrees = {i: j for i, j in zip(self.PLANETS, self.PLANET_DEGREES)}
-        drawn_signs = []
-        for key, value in planet_degrees.items():
-            x1, y1, x2, y2 = self.x_y(angle=value, r1=210, r2=205)
-            line_object(x1, y1, x2, y2, width=2, fill="red")
-            for _key, _value in planet_degrees.items():
-                aspect = value - _value
-                if 0 < aspect < 4:
-                    drawn_signs.append(key)
-                    drawn_signs.append(_key)
-                    self.modify_text_object(planet_symbol=self.PLANET_SYMBOLS[key],
-                                            key=key, value=value, offset=6)
-                elif -4 < aspect < 0:
-                    self.modify_text_object(planet_symbol=self.PLANET_SYMBOLS[key],
-                                            key=key, value=_value, offset=-6)
-        drawn_signs = set(drawn_signs)
-        for key, value in planet_degrees.items():
-            if key not in drawn_signs:
-                self.modify_text_object(planet_symbol=self.PLANET_SYMBOLS[key],
-                                        key=key, value=value, offset=4)
-
-    def create_aspect(self, planet_degrees, value, color, r1=160, r2=165):
-        x1, y1, x2, y2 = self.x_y(angle=value, r1=r1, r2=r2)
-        _x1, _y1, _x2, _y2 = self.x_y(angle=planet_degrees, r1=r1, r2=r2)
-        line_object(x2, y2, _x2, _y2, width=2, fill=color)
-
-    def if_enabled_aspects(self, planet_degrees, value, aspect, color):
-        if ENABLED_ASPECTS[aspect][1].get() == "1":
-            self.create_aspect(planet_degrees, value, color=color)
-
-    def if_enabled_planets(self, _value, value, key, _key, planet_degrees):
-        try:
-            if FROM_WHICH_PLANET[key][1].get() == "1":
-                for i in TO_WHICH_PLANET.keys():
-                    if TO_WHICH_PLANET[i][1].get() == "1":
-                        if value < _value:
-                            if _value - value < 180:
-                                value += 0
-                            elif _value - value > 180:
-                                value += 360
-                        elif value > _value:
-                            if value - _value < 180:
-                                _value += 0
-                            elif value - _value > 180:
-                                _value += 360
-                        midpoint_aspect = (value + _value) / 2
-                        if midpoint_aspect > 360:
-                            midpoint_aspect -= 360
-                        diff = abs(planet_degrees[i] - midpoint_aspect)
-                        self.MIDPOINTS[key, _key] = midpoint_aspect
-                        self.select_aspect(diff, planet_degrees[i], midpoint_aspect, key, f"{key}/{_key}")
-        except KeyError:
-            pass
-
-    def select_aspect(self, aspect, value, planet_degrees, key, _key):
-        default_conjunction = 10
-        default_semi_sextile = 2
-        default_semi_square = 2
-        default_sextile = 10
-        default_quintile = 2
-        default_square = 10
-        default_trine = 10
-        default_sesquiquadrate = 2
-        default_biquintile = 2
-        default_quincunx = 3
-        default_opposite = 10
-        if "Conjunction" in entries.keys():
-            if entries["Conjunction"].get().isnumeric():
-                default_conjunction = int(entries["Conjunction"].get()) / 10
-        elif "Semi-Sextile" in entries.keys():
-            if entries["Semi-Sextile"].get().isnumeric():
-                default_semi_sextile = int(entries["Semi-Sextile"].get()) / 10
-        elif "Semi-Square" in entries.keys():
-            if entries["Semi-Square"].get().isnumeric():
-                default_semi_square = int(entries["Semi-Square"].get()) / 10
-        elif "Sextile" in entries.keys():
-            if entries["Sextile"].get().isnumeric():
-                default_sextile = int(entries["Sextile"].get()) / 10
-        elif "Quintile" in entries.keys():
-            if entries["Quintile"].get().isnumeric():
-                default_quintile = int(entries["Quintile"].get()) / 10
-        elif "Square" in entries.keys():
-            if entries["Square"].get().isnumeric():
-                default_square = int(entries["Square"].get()) / 10
-        elif "Trine" in entries.keys():
-            if entries["Trine"].get().isnumeric():
-                default_trine = int(entries["Trine"].get()) / 10
-        elif "Sesquiquadrate" in entries.keys():
-            if entries["Sesquiquadrate"].get().isnumeric():
-                default_sesquiquadrate = int(entries["Sesquiquadrate"].get()) / 10
-        elif "Biquintile" in entries.keys():
-            if entries["Biquintile"].get().isnumeric():
-                default_biquintile = int(entries["Biquintile"].get()) / 10
-        elif "Quincunx" in entries.keys():
-            if entries["Quincunx"].get().isnumeric():
-                default_quincunx = int(entries["Quincunx"].get()) / 10
-        elif "Opposite" in entries.keys():
-            if entries["Opposite"].get().isnumeric():
-                default_opposite = int(entries["Opposite"].get()) / 10
-        if 0 < aspect < default_conjunction or 360 - default_conjunction < aspect < 360:
-            self.CONJUNCTION.append((key, self.ASPECT_SYMBOLS["Conjunction"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Conjunction", "red")
-        elif 30 - default_semi_sextile < aspect < 30 + default_semi_sextile or \
-                330 - default_semi_sextile < aspect < 330 + default_semi_sextile:
-            self.SEMI_SEXTILE.append((key, self.ASPECT_SYMBOLS["Semi-Sextile"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Semi-Sextile", "black")
-        elif 45 - default_semi_square < aspect < 45 + default_semi_square or \
-                315 - default_semi_square < aspect < 315 + default_semi_square:
-            self.SEMI_SQUARE.append((key, self.ASPECT_SYMBOLS["Semi-Square"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Semi-Square", "black")
-        elif 60 - default_sextile < aspect < 60 + default_sextile or \
-                300 - default_sextile < aspect < 300 + default_sextile:
-            self.SEXTILE.append((key, self.ASPECT_SYMBOLS["Sextile"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Sextile", "blue")
-        elif 72 - default_quintile < aspect < 72 + default_quintile or \
-                288 - default_quintile < aspect < 288 + default_quintile:
-            self.QUINTILE.append((key, self.ASPECT_SYMBOLS["Quintile"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Quintile", "purple")
-        elif 90 - default_square < aspect < 90 + default_square or \
-                270 - default_square < aspect < 270 + default_square:
-            self.SQUARE.append((key, self.ASPECT_SYMBOLS["Square"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Square", "red")
-        elif 120 - default_trine < aspect < 120 + default_trine or \
-                240 - default_trine < aspect < 240 + default_trine:
-            self.TRINE.append((key, self.ASPECT_SYMBOLS["Trine"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Trine", "blue")
-        elif 135 - default_sesquiquadrate < aspect < 135 + default_sesquiquadrate or \
-                225 - default_sesquiquadrate < aspect < 225 + default_sesquiquadrate:
-            self.SESQUIQUADRATE.append((key, self.ASPECT_SYMBOLS["Sesquiquadrate"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Sesquiquadrate", "orange")
-        elif 144 - default_biquintile < aspect < 144 + default_biquintile or \
-                204 - default_biquintile < aspect < 204 + default_biquintile:
-            self.BIQUINTILE.append((key, self.ASPECT_SYMBOLS["BiQuintile"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "BiQuintile", "gray")
-        elif 150 - default_quincunx < aspect < 150 + default_quincunx or \
-                210 - default_quincunx < aspect < 210 + default_quincunx:
-            self.QUINCUNX.append((key, self.ASPECT_SYMBOLS["Quincunx"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Quincunx", "pink")
-        elif 180 - default_opposite < aspect < 180 + default_opposite:
-            self.OPPOSITE.append((key, self.ASPECT_SYMBOLS["Opposite"], _key))
-            self.if_enabled_aspects(planet_degrees, value, "Opposite", "red")
-        else:
-            self.NULL.append((key, self.ASPECT_SYMBOLS["Null"], _key))
-
-    def draw_aspects(self):
-        planet_degrees = {i: j for i, j in zip(self.PLANETS, self.PLANET_DEGREES)}
-        planet_degrees["Asc"] = self.MIDPOINT_OF_HOUSES[0]
-        planet_degrees["Mc"] = self.MIDPOINT_OF_HOUSES[9]
-        for key, value in planet_degrees.items():
-            for _key, _value in planet_degrees.items():
-                aspect = abs(value - _value)
-                if key != _key:
-                    if MIDPOINT["Midpoint"][1].get() == "1":
-                        self.if_enabled_planets(key=key, _key=_key, value=value, _value=_value,
-                                                planet_degrees=planet_degrees)
-                    else:
-                        self.select_aspect(aspect, value, _value, key, _key)
-
-    def draw_midpoints(self, offset=6):
-        planet_symbols = self.PLANET_SYMBOLS
-        planet_symbols["Asc"] = "Asc"
-        planet_symbols["Mc"] = "Mc"
-        for i, j in self.MIDPOINTS.items():
-            x1, y1, x2, y2 = self.x_y(angle=j, r1=280, r2=285)
-            text_object(x=offset + (x1 + x2) / 2, y=offset + (y1 + y2) / 2,
-                        _text=f"{planet_symbols[i[0]]}/{planet_symbols[i[1]]}")
-            x1, y1, x2, y2 = self.x_y(angle=j, r1=260, r2=270)
-            line_object(x1, y1, x2, y2, width=2, fill="red")
-
-    def select_planet(self, i):
-        for key, value in self.ASPECTS.items():
-            if i[0] == key:
-                value.append(i)
-
-    def parse_aspects(self):
-        for i in self.CONJUNCTION:
-            self.select_planet(i)
-        for i in self.SEMI_SEXTILE:
-            self.select_planet(i)
-        for i in self.SEMI_SQUARE:
-            self.select_planet(i)
-        for i in self.SEXTILE:
-            self.select_planet(i)
-        for i in self.QUINTILE:
-            self.select_planet(i)
-        for i in self.SQUARE:
-            self.select_planet(i)
-        for i in self.TRINE:
-            self.select_planet(i)
-        for i in self.SESQUIQUADRATE:
-            self.select_planet(i)
-        for i in self.BIQUINTILE:
-            self.select_planet(i)
-        for i in self.QUINCUNX:
-            self.select_planet(i)
-        for i in self.OPPOSITE:
-            self.select_planet(i)
-        for i in self.NULL:
-            self.select_planet(i)
-
-    def order_aspects(self):
-        for planet in self.ASPECTS:
-            planet_aspects = self.ASPECTS[planet]
-            new_order = []
-            save_aspects = {}
-            for i, j in enumerate(planet_aspects):
-                new_order.append(j[2])
-                save_aspects[j[2]] = j[1]
-            yield [(save_aspects[i], i) for i in self.PLANETS.keys() if i in new_order]
-
-    def new_order_of_the_aspects(self):
-        for i, j in zip(self.order_aspects(), self.ASPECTS):
-            self.ASPECTS[j] = i
-            aspect_list = []
-            for m in i:
-                try:
-                    if list(self.ASPECTS.keys()).index(j) < list(self.ASPECTS.keys()).index(m[1]):
-                        aspect_list.append(m[0])
-                except ValueError:
-                    aspect_list.append(m[0])
-            self.ASPECTS[j] = aspect_list
-        self.ASPECTS["Ascendant"] = []
-        self.ASPECTS["Medium Coeli"] = []
-
-    def modify_info(self, k, x, m, i, count1, count2):
-        if k == self._SIGN_SYMBOLS["Aries"] or k == self._SIGN_SYMBOLS["Leo"] or \
-                k == self._SIGN_SYMBOLS["Sagittarius"]:
-            text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="red")
-        elif k == self._SIGN_SYMBOLS["Taurus"] or k == self._SIGN_SYMBOLS["Virgo"] or \
-                k == self._SIGN_SYMBOLS["Capricorn"]:
-            text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="green")
-        elif k == self._SIGN_SYMBOLS["Gemini"] or k == self._SIGN_SYMBOLS["Libra"] or \
-                k == self._SIGN_SYMBOLS["Aquarius"]:
-            text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="yellow")
-        elif k == self._SIGN_SYMBOLS["Cancer"] or k == self._SIGN_SYMBOLS["Scorpio"] or \
-                k == self._SIGN_SYMBOLS["Pisces"]:
-            text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="blue")
-        elif k in self.SIGNS or "\u00b0" in k or "'" in k or '"' in k or k in self.PLANETS:
-            pass
-        else:
-            text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="black")
-
-    def draw_planet_info(self, x=900):
-        planet_symbols = ""
-        planets = ""
-        degrees = ""
-        minutes = ""
-        seconds = ""
-        sign_symbols = ""
-        signs = ""
-        for i, j in enumerate(self.PLANET_INFO_FORMAT):
-            planet_symbols += f"{j[0]}\n"
-            planets += f"{j[1]}\n"
-            degrees += f"{j[2]}\n"
-            minutes += f"{j[3]}\n"
-            seconds += f"{j[4]}\n"
-            sign_symbols += f"{j[5]}\n"
-            signs += f"{j[6]}\n"
-            for m, k in enumerate(j):
-                if k == self.PLANET_SYMBOLS["Mars"] or k == self.PLANET_SYMBOLS["Venus"]:
-                    if os.name == "posix":
-                        text_object(x=x + 10 + (m * 60), y=15 + (i * 15), font="Arial 15", _text=k)
-                    elif os.name == "nt":
-                        text_object(x=x + 10 + (m * 60), y=15 + (i * 15), font="Arial 9", _text=k)
-                else:
-                    self.modify_info(k=k, x=x, m=m, i=i, count1=10, count2=15)
-        text_object(x=x + 240, y=110, font="Arial 10", _text=signs)
-        text_object(x=x + 60, y=110, font="Arial 10", _text=planets)
-        text_object(x=x + 180, y=110, font="Arial 10", _text=seconds)
-        text_object(x=x + 150, y=110, font="Arial 10", _text=minutes)
-        text_object(x=x + 120, y=110, font="Arial 10", _text=degrees)
-
-    def draw_house_info(self, x=900):
-        houses = ""
-        degrees = ""
-        minutes = ""
-        seconds = ""
-        sign_symbols = ""
-        signs = ""
-        for i, j in enumerate(self.HOUSE_INFO_FORMAT):
-            houses += f"{j[0]}\n"
-            degrees += f"{j[1]}\n"
-            minutes += f"{j[2]}\n"
-            seconds += f"{j[3]}\n"
-            sign_symbols += f"{j[4]}\n"
-            signs += f"{j[5]}\n"
-            for m, k in enumerate(j):
-                if k == j[0]:
-                    pass
-                else:
-                    self.modify_info(k=k, x=x, m=m, i=i, count1=65, count2=220)
-        text_object(x=x + 30, y=315, font="Arial 10", _text=houses)
-        text_object(x=x + 120, y=315, font="Arial 10", _text=degrees)
-        text_object(x=x + 150, y=315, font="Arial 10", _text=minutes)
-        text_object(x=x + 180, y=315, font="Arial 10", _text=seconds)
-        text_object(x=x + 240, y=315, font="Arial 10", _text=signs)
-
-    def draw_aspect_info(self, x=900):
-        for i, j in enumerate(self.ASPECTS.items()):
-            if i != len(self.ASPECTS.items()) - 1:
-                line_object(x1=x + 25 + (i * 25), y1=428 + (i * 15), x2=x + 25 + (i * 25), y2=624, width=1)
-                line_object(x1=x, y1=428 + (i * 15), x2=x + 25 + (i * 25), y2=428 + (i * 15), width=1)
-            if j[0] == "Mars" or j[0] == "Venus":
-                if os.name == "posix":
-                    text_object(x=x + 15 + (i * 25), y=420 + (i * 15), _text=self.PLANET_SYMBOLS[j[0]], font="Arial 15")
-                elif os.name == "nt":
-                    text_object(x=x + 15 + (i * 25), y=420 + (i * 15), _text=self.PLANET_SYMBOLS[j[0]], font="Arial 10")
-            else:
-                text_object(x=x + 15 + (i * 25), y=420 + (i * 15), _text=self.PLANET_SYMBOLS[j[0]], font="Arial 10")
-            for k, m in enumerate(j[1]):
-                if m == self.ASPECT_SYMBOLS["Sextile"] or m == self.ASPECT_SYMBOLS["Trine"]:
-                    text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m, font="Arial 10",
-                                fill="blue")
-                elif m == self.ASPECT_SYMBOLS["Conjunction"] or m == self.ASPECT_SYMBOLS["Square"] or \
-                        m == self.ASPECT_SYMBOLS["Opposite"]:
-                    text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m, font="Arial 10",
-                                fill="red")
-                elif m == self.ASPECT_SYMBOLS["Semi-Sextile"] or m == self.ASPECT_SYMBOLS["Quincunx"]:
-                    text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m, font="Arial 10",
-                                fill="green")
-                else:
-                    text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m, font="Arial 10")
-
-    def chart_info_data(self, calender="Julian"):
-        return "\n".join(
-            [
-                f"{self.day}.{self.month}.{self.year} ({calender})",
-                f"{self.hour}:{self.minute}",
-                f"{self.latitude}",
-                f"{self.longitude}"
-            ]
-        )
-
-    def draw_chart_info(self):
-        variables = self.calender_variables["Julian"]
-        chart_info_titles = "\n".join(
-            [
-                "Date:",
-                "Time:",
-                "Latitude:",
-                "Longitude:",
-            ]
-        )
-        chart_info_datas = "\n".join(
-            [
-                f"{variables[2]}.{variables[1]}.{variables[0]}",
-                f"{self.hour}:{self.minute}",
-                f"{self.latitude}",
-                f"{self.longitude}"
-            ]
-        )
-        text_object(x=75, y=60, _text=chart_info_titles, font="Arial 10", fill="red")
-        text_object(x=175, y=60, _text=chart_info_datas, font="Arial 10")
+def selected_orbs():
+    orbs = {}
+    for key, value in entries.items():
+        if value.get().isnumeric():
+            orbs[key] = int(value.get()) / 10
+    return orbs
+
+
+def checked(dictionary):
+    return [key for key, value in dictionary.items() if value[1].get() == "1"]
+
+
+def chart_settings():
+    midpoint = MIDPOINT["Midpoint"][1].get() == "1"
+    return {
+        "enabled_aspects": checked(ENABLED_ASPECTS),
+        "orbs": selected_orbs(),
+        "midpoint": midpoint,
+        "midpoint_from": checked(FROM_WHICH_PLANET) if midpoint else (),
+        "midpoint_to": checked(TO_WHICH_PLANET) if midpoint else ()
+    }
+
+
+def compute_chart(values, settings, cancel=None):
+    year, month, day, hour, minute, longitude, latitude, zone, dst = values
+    return engine.ChartData(
+        year=year,
+        month=month,
+        day=day,
+        hour=hour,
+        minute=minute,
+        longitude=longitude,
+        latitude=latitude,
+        zone=zone,
+        dst=dst,
+        orbs=settings["orbs"],
+        midpoint_from=settings["midpoint_from"],
+        midpoint_to=settings["midpoint_to"],
+        cancel=cancel
+    )
+
+
+class Chart(render.Wheel):
+    def __init__(self, data, values, settings):
+        self.values = values
+        super().__init__(data, enabled_aspects=settings["enabled_aspects"], midpoint=settings["midpoint"],
+                         backend=render.TkBackend(canvas))
+        self.draw()
+
+    def refresh(self):
+        self.update(**chart_settings())
+
+    def move_to(self, data):
+        self.values = None
+        super().move_to(data)
+
+
+def step_chart(direction):
+    stop_animation()
+    chart.move_to(chart.data.shifted(direction * STEPS[step_unit.get()]))
+
+
+def play_chart(direction):
+    global animation
+    stop_animation()
+    animation = engine.FrameBuffer(chart.data, direction * STEPS[step_unit.get()], executor=executor)
+    root.after(FRAME_INTERVAL, show_frame, animation)
+
+
+def show_frame(buffer):
+    if buffer is not animation:
+        return
+    if not toplevel.winfo_exists():
+        stop_animation()
+        return
+    if buffer.ready():
+        chart.move_to(buffer.next())
+    root.after(FRAME_INTERVAL, show_frame, buffer)
+
+
+def stop_animation():
+    global animation
+    if animation is not None:
+        animation.cancel()
+        animation = None
+
+
+def cancel_job():
+    global job
+    if job is not None:
+        # cancel() only drops a queued job; the event stops one that is already running.
+        job.cancel_event.set()
+        job.cancel()
+        job = None
+
+
+def show_chart(future, values, settings):
+    global canvas, toplevel, chart, job
+    if future is not job:
+        return
+    if not future.done():
+        root.after(POLL_INTERVAL, show_chart, future, values, settings)
+        return
+    job = None
+    try:
+        data = future.result()
+    except (ValueError, ImportError):
+        return
+    toplevel = create_toplevel()
+    canvas = create_canvas(master=toplevel)
+    create_controls(master=toplevel)
+    chart = Chart(data, values, settings)
+    chart.refresh()
 
 
 def on_press_button():
-    global canvas, toplevel
+    global job
     try:
         if not entry_label["Year"][0].get().isnumeric() or not \
                 entry_label["Month"][0].get().isnumeric() or not \
@@ -1055,17 +315,27 @@ def on_press_button():
                 float(entry_label["Longitude"][0].get()):
             pass
         else:
-            toplevel = create_toplevel()
-            canvas = create_canvas(master=toplevel)
-            Chart(
-                year=int(entry_label["Year"][0].get()),
-                month=int(entry_label["Month"][0].get()),
-                day=int(entry_label["Day"][0].get()),
-                hour=int(entry_label["Hour"][0].get()),
-                minute=int(entry_label["Minute"][0].get()),
-                latitude=float(entry_label["Latitude"][0].get()),
-                longitude=float(entry_label["Longitude"][0].get()),
+            values = (
+                int(entry_label["Year"][0].get()),
+                int(entry_label["Month"][0].get()),
+                int(entry_label["Day"][0].get()),
+                int(entry_label["Hour"][0].get()),
+                int(entry_label["Minute"][0].get()),
+                float(entry_label["Longitude"][0].get()),
+                float(entry_label["Latitude"][0].get()),
+                entry_label["Zone"][0].get().strip() or None,
+                DAY_LIGHT_SAVE_TIME["DST (on/off)"][1].get() == "1"
             )
+            cancel_job()
+            stop_animation()
+            if chart is not None and chart.values == values and toplevel.winfo_exists():
+                chart.refresh()
+                return
+            settings = chart_settings()
+            cancel = threading.Event()
+            job = executor.submit(compute_chart, values, settings, cancel)
+            job.cancel_event = cancel
+            root.after(POLL_INTERVAL, show_chart, job, values, settings)
     except ValueError:
         pass
 
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import numbers
+import numpy as np
+
+ASPECTS = {
+    "Conjunction": 0,
+    "Semi-Sextile": 30,
+    "Semi-Square": 45,
+    "Sextile": 60,
+    "Quintile": 72,
+    "Square": 90,
+    "Trine": 120,
+    "Sesquiquadrate": 135,
+    "BiQuintile": 144,
+    "Quincunx": 150,
+    "Opposite": 180,
+}
+
+DEFAULT_ORBS = {
+    "Conjunction": 10,
+    "Semi-Sextile": 2,
+    "Semi-Square": 2,
+    "Sextile": 10,
+    "Quintile": 2,
+    "Square": 10,
+    "Trine": 10,
+    "Sesquiquadrate": 2,
+    "BiQuintile": 2,
+    "Quincunx": 3,
+    "Opposite": 10,
+}
+
+HARMONICS = {
+    "Conjunction": 1,
+    "Semi-Sextile": 12,
+    "Semi-Square": 8,
+    "Sextile": 6,
+    "Quintile": 5,
+    "Square": 4,
+    "Trine": 3,
+    "Sesquiquadrate": 8,
+    "BiQuintile": 5,
+    "Quincunx": 12,
+    "Opposite": 2,
+}
+
+ASPECT_NAMES = tuple(ASPECTS)
+
+COLUMNS = "chart", "body_a", "body_b", "aspect", "angle", "orb", "separation", "applying"
+
+
+def is_number(value):
+    return isinstance(value, numbers.Real) and not isinstance(value, bool)
+
+
+def is_integer(value):
+    return isinstance(value, numbers.Integral) and not isinstance(value, bool)
+
+
+class AspectProfile:
+    def __init__(self, aspects, orb_factors=None, name="default"):
+        self.name = name
+        self.aspects = [self.validate(i) for i in aspects]
+        self.orb_factors = dict(orb_factors or {})
+        names = [i["name"] for i in self.aspects]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate aspect names in profile {name!r}")
+        for key, value in self.orb_factors.items():
+            if not is_number(value) or not value > 0:
+                raise ValueError(f"Orb factor of {key!r} must be positive")
+        self.names = tuple(names)
+        self.angles = np.array([i["angle"] for i in self.aspects], dtype=np.float64)
+        self.orbs = np.array([i["orb"] for i in self.aspects], dtype=np.float64)
+        self.harmonics = np.array([i["harmonic"] for i in self.aspects], dtype=np.int16)
+        self.index = {j: i for i, j in enumerate(self.names)}
+        self._factors = {}
+        self._fingerprint = None
+
+    @staticmethod
+    def validate(aspect):
+        if not isinstance(aspect, dict):
+            raise ValueError(f"Aspect must be an object: {aspect!r}")
+        aspect = dict(aspect)
+        if not isinstance(aspect.get("name"), str):
+            raise ValueError(f"Aspect without a name: {aspect!r}")
+        name = aspect["name"]
+        harmonic = aspect.get("harmonic", 1)
+        if not is_integer(harmonic) or harmonic < 1:
+            raise ValueError(f"Harmonic of aspect {name!r} must be a positive integer")
+        multiple = aspect.get("multiple", 1)
+        if not is_integer(multiple) or multiple < 1:
+            raise ValueError(f"Multiple of aspect {name!r} must be a positive integer")
+        if "angle" not in aspect:
+            if "harmonic" not in aspect:
+                raise ValueError(f"Aspect {name!r} needs an angle or a harmonic")
+            aspect["angle"] = 360 * multiple / harmonic
+        if not is_number(aspect["angle"]) or not 0 <= aspect["angle"] <= 180:
+            raise ValueError(f"Angle of aspect {name!r} must be between 0 and 180")
+        if not is_number(aspect.get("orb")) or not 0 < aspect["orb"] < 180:
+            raise ValueError(f"Orb of aspect {name!r} must be between 0 and 180")
+        aspect["harmonic"] = harmonic
+        return aspect
+
+    @classmethod
+    def from_dict(cls, profile):
+        if not isinstance(profile, dict) or not isinstance(profile.get("aspects"), list):
+            raise ValueError("An aspect profile must be an object with a list of aspects")
+        if not isinstance(profile.get("orb_factors") or {}, dict):
+            raise ValueError("orb_factors must be an object")
+        return cls(profile["aspects"], orb_factors=profile.get("orb_factors"), name=profile.get("name", "default"))
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+    def to_dict(self):
+        return {"name": self.name, "aspects": self.aspects, "orb_factors": self.orb_factors}
+
+    @property
+    def fingerprint(self):
+        if self._fingerprint is None:
+            profile = {"aspects": self.aspects, "orb_factors": self.orb_factors}
+            self._fingerprint = hashlib.sha1(json.dumps(profile, sort_keys=True).encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def with_orbs(self, orbs, name=None):
+        aspects = []
+        for i in self.aspects:
+            i = dict(i)
+            if i["name"] in orbs:
+                i["orb"] = orbs[i["name"]]
+            aspects.append(i)
+        return AspectProfile(aspects, orb_factors=self.orb_factors, name=name or self.name)
+
+    def factors(self, bodies):
+        bodies = tuple(bodies)
+        try:
+            return self._factors[bodies]
+        except KeyError:
+            factors = np.array([self.orb_factors.get(i, 1.0) for i in bodies], dtype=np.float64)
+            self._factors[bodies] = factors
+            return factors
+
+    def pair_orbs(self, a, b, bodies=None):
+        if bodies is None or not self.orb_factors:
+            return self.orbs
+        factors = self.factors(bodies)
+        return np.maximum(factors[a], factors[b])[:, None] * self.orbs
+
+    def match(self, separation, factor=1.0):
+        deviation = np.abs(separation - self.angles)
+        within = (deviation < self.orbs * factor) & ((self.angles > 0) | (separation > 0))
+        if within.any():
+            return self.names[within.argmax()]
+
+
+DEFAULT_PROFILE = AspectProfile(
+    [{"name": i, "angle": j, "orb": DEFAULT_ORBS[i], "harmonic": HARMONICS[i]} for i, j in ASPECTS.items()])
+
+
+class AspectTable:
+    def __init__(self, chart, body_a, body_b, aspect, angle, orb, separation, applying=None,
+                 names=ASPECT_NAMES):
+        self.chart = chart
+        self.body_a = body_a
+        self.body_b = body_b
+        self.aspect = aspect
+        self.angle = angle
+        self.orb = orb
+        self.separation = separation
+        self.applying = applying
+        self.names = names
+
+    def __len__(self):
+        return len(self.chart)
+
+    def to_dict(self):
+        columns = {i: getattr(self, i) for i in COLUMNS if getattr(self, i) is not None}
+        columns = {i: j.tolist() for i, j in columns.items()}
+        columns["names"] = list(self.names)
+        return columns
+
+    @classmethod
+    def from_dict(cls, columns):
+        return cls(
+            chart=np.asarray(columns["chart"], dtype=np.int64),
+            body_a=np.asarray(columns["body_a"], dtype=np.int16),
+            body_b=np.asarray(columns["body_b"], dtype=np.int16),
+            aspect=np.asarray(columns["aspect"], dtype=np.int8),
+            angle=np.asarray(columns["angle"], dtype=np.float64),
+            orb=np.asarray(columns["orb"], dtype=np.float64),
+            separation=np.asarray(columns["separation"], dtype=np.float64),
+            applying=np.asarray(columns["applying"], dtype=bool) if "applying" in columns else None,
+            names=tuple(columns["names"])
+        )
+
+    def rows(self, bodies):
+        for a, aspect, b in zip(self.body_a, self.aspect, self.body_b):
+            yield bodies[a], self.names[aspect], bodies[b]
+
+    @classmethod
+    def empty(cls, names=ASPECT_NAMES):
+        return cls(
+            chart=np.empty(0, dtype=np.int64),
+            body_a=np.empty(0, dtype=np.int16),
+            body_b=np.empty(0, dtype=np.int16),
+            aspect=np.empty(0, dtype=np.int8),
+            angle=np.empty(0),
+            orb=np.empty(0),
+            separation=np.empty(0),
+            applying=np.empty(0, dtype=bool),
+            names=names
+        )
+
+    @classmethod
+    def concatenate(cls, tables, names=ASPECT_NAMES):
+        tables = list(tables)
+        if not tables:
+            return cls.empty(names=names)
+        columns = {i: np.concatenate([getattr(j, i) for j in tables]) for i in COLUMNS[:-1]}
+        if all(i.applying is not None for i in tables):
+            columns["applying"] = np.concatenate([i.applying for i in tables])
+        return cls(names=tables[0].names, **columns)
+
+
+def aspect_points(degree, angle):
+    # Conjunctions and oppositions have one aspect point. Computed twice, the two values can
+    # differ in the last bit and would count the same aspect twice.
+    if angle < 1e-9 or 180 - angle < 1e-9:
+        return (degree + angle) % 360,
+    return (degree + angle) % 360, (degree - angle) % 360
+
+
+def pairs(n):
+    return np.triu_indices(n, 1)
+
+
+def separations(degrees, a, b):
+    diff = (degrees[..., a] - degrees[..., b]) % 360
+    return np.where(diff > 180, 360 - diff, diff), diff <= 180
+
+
+def find_aspects(degrees, profile=None, speeds=None, bodies=None, offset=0):
+    if profile is None:
+        profile = DEFAULT_PROFILE
+    degrees = np.atleast_2d(np.asarray(degrees, dtype=np.float64))
+    a, b = pairs(degrees.shape[1])
+    separation, forward = separations(degrees, a, b)
+    deviation = np.abs(separation[..., None] - profile.angles)
+    within = (deviation < profile.pair_orbs(a, b, bodies)) & ((profile.angles > 0) | (separation[..., None] > 0))
+    chart, pair = np.nonzero(within.any(axis=-1))
+    aspect = within[chart, pair].argmax(axis=-1).astype(np.int8)
+    separation = separation[chart, pair]
+    angle = profile.angles[aspect]
+    applying = None
+    if speeds is not None:
+        speeds = np.atleast_2d(np.asarray(speeds, dtype=np.float64))
+        rate = speeds[chart, a[pair]] - speeds[chart, b[pair]]
+        rate = np.where(forward[chart, pair], rate, -rate)
+        applying = (separation - angle) * rate < 0
+    return AspectTable(
+        chart=chart + offset,
+        body_a=a[pair].astype(np.int16),
+        body_b=b[pair].astype(np.int16),
+        aspect=aspect,
+        angle=angle,
+        orb=np.abs(separation - angle),
+        separation=separation,
+        applying=applying,
+        names=profile.names
+    )
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import swisseph as swe
+import engine
+
+
+def wrap(longitude):
+    return (np.asarray(longitude) + 180) % 360 - 180
+
+
+def obliquity(jd):
+    return engine.cached_calc_ut(jd, swe.ECL_NUT)[0]
+
+
+def sidereal_time(jd):
+    return swe.sidtime(jd) * 15
+
+
+def angles(ramc, latitude, eps):
+    ramc = np.radians(ramc)
+    latitude = np.radians(latitude)
+    eps = np.radians(eps)
+    mc = np.degrees(np.arctan2(np.sin(ramc), np.cos(ramc) * np.cos(eps))) % 360
+    asc = np.degrees(np.arctan2(
+        np.cos(ramc), -(np.sin(ramc) * np.cos(eps) + np.tan(latitude) * np.sin(eps)))) % 360
+    return asc, mc
+
+
+def houses_row(jd, latitude, longitudes, house_system="P"):
+    engine.ensure_ephe_path()
+    cusps = np.full((len(longitudes), 12), np.nan)
+    ascmc = np.empty((len(longitudes), 2))
+    for i, longitude in enumerate(longitudes):
+        try:
+            houses = swe.houses(jd, latitude, longitude, house_system.encode())
+            cusps[i] = houses[0][:12]
+        except swe.Error:
+            # Placidus and Koch have no cusps inside the polar circles, but the angles exist there too.
+            houses = swe.houses(jd, latitude, longitude, b"O")
+        ascmc[i] = houses[1][:2]
+    return cusps, ascmc
+
+
+def angles_grid(jd, latitudes, longitudes, exact=False, workers=None, house_system="P", ephe_path=None):
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    if exact:
+        if workers == 1:
+            rows = [houses_row(jd, i, longitudes, house_system) for i in latitudes]
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=engine.set_ephe_path,
+                                     initargs=(ephe_path or engine.default_ephe_path(),)) as executor:
+                rows = list(executor.map(
+                    houses_row, [jd] * len(latitudes), latitudes, [longitudes] * len(latitudes),
+                    [house_system] * len(latitudes)))
+        cusps = np.stack([i[0] for i in rows])
+        ascmc = np.stack([i[1] for i in rows])
+        asc, mc = ascmc[:, :, 0], ascmc[:, :, 1]
+    else:
+        engine.ensure_ephe_path()
+        cusps = None
+        ramc = (sidereal_time(jd) + longitudes)[None, :]
+        asc, mc = angles(ramc, latitudes[:, None], obliquity(jd))
+        # The MC does not depend on the latitude; every mode returns (latitudes, longitudes) arrays.
+        mc = np.broadcast_to(mc, asc.shape)
+    grid = {
+        "asc": asc,
+        "mc": mc,
+        "dsc": (asc + 180) % 360,
+        "ic": (mc + 180) % 360
+    }
+    if cusps is not None:
+        grid["cusps"] = cusps
+    return grid
+
+
+def positions(jd, planets=None):
+    engine.ensure_ephe_path()
+    if planets is None:
+        planets = engine.PLANETS
+    ecliptic = {}
+    equatorial = {}
+    for name, planet in planets.items():
+        ecliptic[name] = engine.cached_calc_ut(jd, planet)[0]
+        equatorial[name] = engine.cached_calc_ut(jd, planet, engine.FLAGS | swe.FLG_EQUATORIAL)[:2]
+    return ecliptic, equatorial
+
+
+def planet_lines(jd, latitudes, planets=None):
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    gst = sidereal_time(jd)
+    lines = {}
+    for name, (ra, dec) in positions(jd, planets)[1].items():
+        mc = wrap(ra - gst)
+        cos_h = -np.tan(np.radians(latitudes)) * np.tan(np.radians(dec))
+        with np.errstate(invalid="ignore"):
+            h = np.degrees(np.arccos(cos_h))
+        h[np.abs(cos_h) > 1] = np.nan
+        lines[name] = {
+            "mc": float(mc),
+            "ic": float(wrap(mc + 180)),
+            "asc": wrap(mc - h),
+            "dsc": wrap(mc + h)
+        }
+    return lines
+
+
+def crossings(values, target, longitudes):
+    diff = (values - target + 180) % 360 - 180
+    line = np.full(values.shape[0], np.nan)
+    change = (diff[:, :-1] <= 0) & (diff[:, 1:] > 0)
+    rows, columns = np.nonzero(change)
+    first = np.unique(rows, return_index=True)
+    rows, columns = first[0], columns[first[1]]
+    d0 = diff[rows, columns]
+    d1 = diff[rows, columns + 1]
+    fraction = -d0 / (d1 - d0)
+    line[rows] = longitudes[columns] + fraction * (longitudes[columns + 1] - longitudes[columns])
+    return line
+
+
+def zodiacal_lines(jd, grid, longitudes, planets=None):
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    lines = {}
+    for name, degree in positions(jd, planets)[0].items():
+        lines[name] = {i: crossings(grid[i], degree, longitudes) for i in ("asc", "dsc", "mc", "ic")}
+    return lines
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import swisseph as swe
+import engine
+import timezones
+from aspects import DEFAULT_PROFILE, AspectTable, find_aspects
+
+FIELDS = "year", "month", "day", "hour", "minute", "latitude", "longitude"
+
+CHUNK_SIZE = 65536
+
+
+class BatchResult:
+    def __init__(self, n, planets):
+        self.planets = tuple(planets)
+        self.bodies = self.planets + engine.ANGLES
+        self.jd = np.full(n, np.nan)
+        self.positions = np.full((n, len(self.planets), 4), np.nan)
+        self.cusps = np.full((n, 12), np.nan)
+        self.asc = np.full(n, np.nan)
+        self.mc = np.full(n, np.nan)
+        self.aspects = None
+
+    def __len__(self):
+        return len(self.jd)
+
+    @property
+    def degrees(self):
+        return np.column_stack([self.positions[:, :, 0], self.asc, self.mc])
+
+    @property
+    def speeds(self):
+        return np.column_stack([self.positions[:, :, 3], np.zeros((len(self), len(engine.ANGLES)))])
+
+    def aspects_for(self, profile):
+        degrees = self.degrees
+        speeds = self.speeds
+        return AspectTable.concatenate((
+            find_aspects(degrees[i:i + CHUNK_SIZE], profile=profile, speeds=speeds[i:i + CHUNK_SIZE],
+                         bodies=self.bodies, offset=i)
+            for i in range(0, len(self), CHUNK_SIZE)), names=profile.names)
+
+
+def as_columns(records, dst=False):
+    if isinstance(records, np.ndarray) and records.dtype.names:
+        columns = {i: records[i] for i in FIELDS}
+        if "dst" in records.dtype.names:
+            columns["dst"] = records["dst"].astype(bool)
+        else:
+            columns["dst"] = np.full(len(records), dst)
+        if "zone" in records.dtype.names:
+            zones = records["zone"]
+            if zones.dtype.kind == "S":
+                zones = np.char.decode(zones, "utf-8")
+            columns["zone"] = zones.astype(object)
+        else:
+            columns["zone"] = np.full(len(records), None, dtype=object)
+        return columns
+    columns = {i: [] for i in FIELDS + ("dst", "zone")}
+    for record in records:
+        if isinstance(record, dict):
+            for i in FIELDS:
+                columns[i].append(record[i])
+            columns["dst"].append(bool(record.get("dst", dst)))
+            columns["zone"].append(record.get("zone"))
+        else:
+            for i, j in zip(FIELDS, record):
+                columns[i].append(j)
+            columns["dst"].append(bool(record[7]) if len(record) > 7 else dst)
+            columns["zone"].append(record[8] if len(record) > 8 else None)
+    columns = {i: np.asarray(j) for i, j in columns.items()}
+    columns["zone"] = columns["zone"].astype(object)
+    return columns
+
+
+def fill_zones(columns):
+    zones = columns["zone"]
+    missing = np.array([not i for i in zones], dtype=bool)
+    if missing.any():
+        zones = zones.copy()
+        zones[missing] = timezones.zones_at(
+            np.asarray(columns["latitude"], dtype=np.float64)[missing],
+            np.asarray(columns["longitude"], dtype=np.float64)[missing])
+    return zones
+
+
+def compute_chart(result, i, year, month, day, hour, minute, latitude, longitude, planets, calendar=None,
+                  zone=None, dst=False, house_system="P"):
+    try:
+        jd = engine.julday(year, month, day, hour, minute, latitude, longitude, calendar, zone, dst)
+    except ValueError:
+        return
+    try:
+        cusps, ascmc = swe.houses(jd, latitude, longitude, house_system.encode())
+    except swe.Error:
+        # Placidus and Koch have no cusps inside the polar circles.
+        return
+    result.jd[i] = jd
+    result.cusps[i] = cusps[:12]
+    result.asc[i] = ascmc[0]
+    result.mc[i] = ascmc[1]
+    for j, planet in enumerate(planets):
+        try:
+            result.positions[i, j] = engine.cached_calc_ut(jd, planet)[:4]
+        except swe.Error:
+            pass
+
+
+def compute_batch(records, dst=False, orbs=None, planets=None, profile=None, calendar=None, house_system="P"):
+    engine.ensure_ephe_path()
+    profile = profile or DEFAULT_PROFILE
+    if orbs:
+        profile = profile.with_orbs(orbs)
+    if planets is None:
+        planets = engine.PLANETS
+    columns = as_columns(records, dst=dst)
+    result = BatchResult(len(columns["year"]), planets)
+    planets = list(planets.values())
+    zones = fill_zones(columns)
+    for i in range(len(result)):
+        compute_chart(
+            result,
+            i,
+            year=int(columns["year"][i]),
+            month=int(columns["month"][i]),
+            day=int(columns["day"][i]),
+            hour=int(columns["hour"][i]),
+            minute=int(columns["minute"][i]),
+            latitude=float(columns["latitude"][i]),
+            longitude=float(columns["longitude"][i]),
+            planets=planets,
+            calendar=calendar,
+            zone=zones[i],
+            dst=bool(columns["dst"][i]),
+            house_system=house_system
+        )
+    result.aspects = result.aspects_for(profile)
+    return result
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+import json
+import sqlite3
+import threading
+
+import engine
+
+# Hits update the LRU clock in memory; the clock is written back in batches of this size.
+FLUSH_SIZE = 1000
+
+
+class ChartCache:
+    def __init__(self, path, max_entries=100000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        self.used = {}
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS charts (key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS charts_used ON charts (used)")
+        self.connection.commit()
+        self.entries, self.clock = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(MAX(used), 0) FROM charts").fetchone()
+
+    def __len__(self):
+        return self.entries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def key(jd, latitude, longitude, house_system="P", planets=None):
+        if planets is None:
+            planets = engine.PLANETS
+        bodies = ",".join(str(i) for i in planets.values())
+        return f"{engine.ENGINE_VERSION}|{jd:.6f}|{latitude:.6f}|{longitude:.6f}|{house_system}|{bodies}"
+
+    def tick(self):
+        self.clock += 1
+        return self.clock
+
+    def get(self, key):
+        with self.lock:
+            row = self.connection.execute("SELECT value FROM charts WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.used[key] = self.tick()
+            if len(self.used) >= FLUSH_SIZE:
+                self.flush()
+                self.connection.commit()
+            return json.loads(row[0])
+
+    def flush(self):
+        if self.used:
+            self.connection.executemany("UPDATE charts SET used = ? WHERE key = ?",
+                                        [(used, key) for key, used in self.used.items()])
+            self.used.clear()
+
+    def put(self, key, value):
+        with self.lock:
+            self.flush()
+            cursor = self.connection.execute("SELECT 1 FROM charts WHERE key = ?", (key,))
+            if cursor.fetchone() is None:
+                self.entries += 1
+            cursor.execute(
+                "INSERT OR REPLACE INTO charts (key, value, used) VALUES (?, ?, ?)",
+                (key, json.dumps(value), self.tick()))
+            if self.entries > self.max_entries:
+                excess = self.entries - self.max_entries
+                cursor.execute(
+                    "DELETE FROM charts WHERE key IN (SELECT key FROM charts ORDER BY used LIMIT ?)", (excess,))
+                self.evictions += excess
+                self.entries -= excess
+            self.connection.commit()
+
+    def clear(self):
+        with self.lock:
+            self.used.clear()
+            self.connection.execute("DELETE FROM charts")
+            self.connection.commit()
+            self.entries = 0
+
+    def close(self):
+        with self.lock:
+            self.flush()
+            self.connection.commit()
+            self.connection.close()
+
+    @property
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": self.entries,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from collections import deque
+
+import batch
+import engine
+import parallel
+from aspects import DEFAULT_PROFILE, AspectProfile
+
+INTEGER_FIELDS = "year", "month", "day", "hour", "minute"
+FLOAT_FIELDS = "latitude", "longitude"
+TRUE_VALUES = "1", "true", "yes", "on"
+HOUSES = tuple(f"House {i}" for i in range(1, 13))
+
+
+def data_format(path, default):
+    if path is None or path == "-":
+        return default
+    if os.path.splitext(path)[1].lower() in (".jsonl", ".json", ".ndjson"):
+        return "jsonl"
+    return "csv"
+
+
+def read_rows(file, fmt):
+    if fmt == "csv":
+        yield from csv.DictReader(file)
+        return
+    for line in file:
+        if line.strip():
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # Passed on as it is: read_records reports it and it is written without a chart.
+                yield line.rstrip("\r\n")
+
+
+def parse_flag(value):
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_VALUES
+    return bool(value)
+
+
+def parse_record(row):
+    if not isinstance(row, dict):
+        raise ValueError(f"not a JSON object: {row!r}")
+    record = [int(row[i]) for i in INTEGER_FIELDS] + [float(row[i]) for i in FLOAT_FIELDS]
+    record.append(parse_flag(row.get("dst") or False))
+    record.append(row.get("zone") or None)
+    return tuple(record)
+
+
+def read_records(rows, pending, errors):
+    for number, row in enumerate(rows, 1):
+        try:
+            record = parse_record(row)
+        except (KeyError, TypeError, ValueError) as error:
+            pending.append((row, False))
+            errors.write(f"record {number}: {error!r}\n")
+            continue
+        pending.append((row, True))
+        yield record
+
+
+def compute(records, args, planets, profile):
+    if args.workers == 1:
+        engine.ensure_ephe_path()
+        for offset, chunk in parallel.chunks(records, args.chunk_size):
+            yield offset, batch.compute_batch(chunk, planets=planets, profile=profile, calendar=args.calendar,
+                                              house_system=args.house_system)
+        return
+    yield from parallel.compute_parallel(records, workers=args.workers, chunk_size=args.chunk_size, planets=planets,
+                                         profile=profile, calendar=args.calendar, house_system=args.house_system,
+                                         ephe_path=args.ephe_path)
+
+
+def number(value):
+    return None if math.isnan(value) else value
+
+
+def chart_rows(result):
+    jd = result.jd.tolist()
+    positions = result.positions.tolist()
+    cusps = result.cusps.tolist()
+    asc = result.asc.tolist()
+    mc = result.mc.tolist()
+    table = result.aspects
+    bounds = table.chart.searchsorted(range(len(result) + 1)).tolist()
+    body_a, body_b = table.body_a.tolist(), table.body_b.tolist()
+    aspect, orb = table.aspect.tolist(), table.orb.tolist()
+    for i in range(len(result)):
+        if math.isnan(jd[i]):
+            yield None
+            continue
+        yield {
+            "jd": jd[i],
+            "positions": {
+                name: {
+                    "longitude": number(value[0]),
+                    "latitude": number(value[1]),
+                    "distance": number(value[2]),
+                    "speed": number(value[3])
+                }
+                for name, value in zip(result.planets, positions[i])
+            },
+            "asc": asc[i],
+            "mc": mc[i],
+            "cusps": cusps[i],
+            "aspects": [
+                [result.bodies[body_a[j]], table.names[aspect[j]], result.bodies[body_b[j]], orb[j]]
+                for j in range(bounds[i], bounds[i + 1])
+            ]
+        }
+
+
+class JsonlWriter:
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, row, chart):
+        if not isinstance(row, dict):
+            row = {"input": row}
+        if chart is None:
+            row = dict(row, error="invalid record")
+        else:
+            row = dict(row, **chart)
+        self.file.write(json.dumps(row) + "\n")
+
+
+class CsvWriter:
+    def __init__(self, file, planets):
+        self.file = file
+        self.planets = planets
+        self.writer = None
+
+    def columns(self):
+        columns = ["jd"]
+        for name in self.planets:
+            columns.extend((name, f"{name} speed"))
+        return columns + ["Asc", "Mc"] + list(HOUSES) + ["Aspects"]
+
+    def write(self, row, chart):
+        if not isinstance(row, dict):
+            row = {"input": row}
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.file, list(row) + self.columns(), extrasaction="ignore")
+            self.writer.writeheader()
+        row = dict(row)
+        if chart is not None:
+            row["jd"] = chart["jd"]
+            for name, position in chart["positions"].items():
+                row[name] = position["longitude"]
+                row[f"{name} speed"] = position["speed"]
+            row["Asc"] = chart["asc"]
+            row["Mc"] = chart["mc"]
+            row.update(zip(HOUSES, chart["cusps"]))
+            row["Aspects"] = ";".join(f"{a} {aspect} {b} {orb:.4f}" for a, aspect, b, orb in chart["aspects"])
+        self.writer.writerow(row)
+
+
+def select_planets(names):
+    if not names:
+        return dict(engine.PLANETS)
+    planets = {}
+    for name in names.split(","):
+        name = name.strip()
+        if name not in engine.PLANETS:
+            raise argparse.ArgumentTypeError(f"unknown body: {name}")
+        planets[name] = engine.PLANETS[name]
+    return planets
+
+
+def parser():
+    parser = argparse.ArgumentParser(
+        description="Compute charts for birth records read from CSV or JSONL and stream them out row by row.")
+    parser.add_argument("input", nargs="?", default="-", help="input file, - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="output file, - for stdout (default)")
+    parser.add_argument("--input-format", choices=("csv", "jsonl"), help="defaults to the input file extension")
+    parser.add_argument("--output-format", choices=("csv", "jsonl"), help="defaults to the output file extension")
+    parser.add_argument("--bodies", type=select_planets, default=None,
+                        help="comma separated bodies, e.g. Sun,Moon,Venus (default: all)")
+    parser.add_argument("--house-system", default="P", help="Swiss Ephemeris house system letter (default: P)")
+    parser.add_argument("--profile", help="aspect profile JSON file")
+    parser.add_argument("--calendar", choices=engine.CALENDARS, help="calendar of the dates (default: by 1582 reform)")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (default: 1)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="records per chunk (default: 1000)")
+    parser.add_argument("--ephe-path", help="Swiss Ephemeris folder (default: Eph next to engine.py)")
+    return parser
+
+
+def open_file(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="", encoding="utf-8")
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    if len(args.house_system) != 1:
+        raise SystemExit("error: --house-system takes one letter")
+    if args.workers < 1 or args.chunk_size < 1:
+        raise SystemExit("error: --workers and --chunk-size must be positive")
+    engine.set_ephe_path(args.ephe_path)
+    planets = args.bodies or dict(engine.PLANETS)
+    try:
+        profile = AspectProfile.from_file(args.profile) if args.profile else DEFAULT_PROFILE
+    except (OSError, ValueError) as error:
+        raise SystemExit(f"error: --profile: {error}")
+    source = open_file(args.input, "r")
+    target = open_file(args.output, "w")
+    try:
+        if (args.output_format or data_format(args.output, "jsonl")) == "csv":
+            writer = CsvWriter(target, planets)
+        else:
+            writer = JsonlWriter(target)
+        pending = deque()
+        written = 0
+        rows = read_rows(source, args.input_format or data_format(args.input, "csv"))
+        for offset, result in compute(read_records(rows, pending, sys.stderr), args, planets, profile):
+            for chart in chart_rows(result):
+                row, valid = pending.popleft()
+                while not valid:
+                    writer.write(row, None)
+                    written += 1
+                    row, valid = pending.popleft()
+                writer.write(row, chart)
+                written += 1
+                if chart is None:
+                    sys.stderr.write(f"record {written}: no chart for this date, zone or location\n")
+        while pending:
+            writer.write(pending.popleft()[0], None)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+        else:
+            target.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import os
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import swisseph as swe
+import aspects
+import timezones
+from midpoints import MidpointIndex
+from aspects import DEFAULT_PROFILE
+
+PLANETS = {
+    "Sun": swe.SUN,
+    "Moon": swe.MOON,
+    "Mercury": swe.MERCURY,
+    "Venus": swe.VENUS,
+    "Mars": swe.MARS,
+    "Jupiter": swe.JUPITER,
+    "Saturn": swe.SATURN,
+    "Uranus": swe.URANUS,
+    "Neptune": swe.NEPTUNE,
+    "Pluto": swe.PLUTO,
+    "North Node": swe.TRUE_NODE,
+    "Chiron": swe.CHIRON
+}
+
+ANGLES = "Asc", "Mc"
+
+SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+         "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+ENGINE_VERSION = 1
+
+FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+CALENDARS = "Julian", "Gregorian"
+
+# Day number of 1582-10-15, the first day of the Gregorian calendar.
+GREGORIAN_REFORM = 2299161
+
+_ephe_path = None
+_thread = threading.local()
+
+
+class EphemerisCache:
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.values = OrderedDict()
+
+    def __len__(self):
+        return len(self.values)
+
+    def call(self, key, function, *args):
+        with self.lock:
+            if key in self.values:
+                self.values.move_to_end(key)
+                self.hits += 1
+                return self.values[key], False
+            self.misses += 1
+        value = function(*args)
+        if self.capacity > 0:
+            with self.lock:
+                self.values[key] = value
+                self.values.move_to_end(key)
+                while len(self.values) > self.capacity:
+                    self.values.popitem(last=False)
+        return value, True
+
+    def resize(self, capacity):
+        with self.lock:
+            self.capacity = capacity
+            while len(self.values) > max(capacity, 0):
+                self.values.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.values.clear()
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hit_rate,
+                "entries": len(self.values), "capacity": self.capacity}
+
+
+EPHEMERIS_CACHE = EphemerisCache()
+
+
+def default_ephe_path():
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Eph")
+    if not os.path.isdir(path):
+        path = os.path.join(os.getcwd(), "Eph")
+    return path
+
+
+def set_ephe_path(path=None):
+    global _ephe_path
+    if path is None:
+        path = default_ephe_path()
+    swe.set_ephe_path(path)
+    _ephe_path = path
+    _thread.ephe_path = path
+    return path
+
+
+def ensure_ephe_path():
+    # The Swiss Ephemeris keeps its path and open files per thread.
+    if _ephe_path is None or getattr(_thread, "ephe_path", None) != _ephe_path:
+        set_ephe_path(_ephe_path)
+
+
+def sign_dms(angle):
+    seconds = round(angle % 360 * 3600) % 1296000
+    sign, seconds = divmod(seconds, 108000)
+    degree, seconds = divmod(seconds, 3600)
+    return sign, degree, *divmod(seconds, 60)
+
+
+def sign_index(angle):
+    return int(angle % 360 // 30) % 12
+
+
+def house_index(angle, cusps):
+    offsets = [(i - cusps[0]) % 360 for i in cusps]
+    return bisect_right(offsets, (angle - cusps[0]) % 360) - 1
+
+
+class Position:
+    __slots__ = "longitude", "latitude", "distance", "speed", "sign", "house"
+
+    def __init__(self, longitude, latitude=0.0, distance=0.0, speed=0.0, cusps=None):
+        self.longitude = longitude
+        self.latitude = latitude
+        self.distance = distance
+        self.speed = speed
+        self.sign = sign_index(longitude)
+        self.house = house_index(longitude, cusps) if cusps is not None else None
+
+    @property
+    def degree(self):
+        return self.longitude % 360 - self.sign * 30
+
+    def __repr__(self):
+        return f"Position(longitude={self.longitude:.6f}, sign={SIGNS[self.sign]}, house={self.house})"
+
+
+def reform_calendar(number):
+    return "Julian" if number < GREGORIAN_REFORM else "Gregorian"
+
+
+def _day_number(year, month, day, calendar):
+    a = (14 - month) // 12
+    y = year + 4800 - a
+    m = month + 12 * a - 3
+    number = day + (153 * m + 2) // 5 + 365 * y + y // 4
+    if calendar == "Julian":
+        return number - 32083
+    return number - y // 100 + y // 400 - 32045
+
+
+def calendar_date(number, calendar=None):
+    if calendar is None:
+        calendar = reform_calendar(number)
+    if calendar == "Julian":
+        b, c = 0, number + 32082
+    else:
+        a = number + 32044
+        b = (4 * a + 3) // 146097
+        c = a - 146097 * b // 4
+    d = (4 * c + 3) // 1461
+    e = c - 1461 * d // 4
+    m = (5 * e + 2) // 153
+    return 100 * b + d - 4800 + m // 10, m + 3 - 12 * (m // 10), e - (153 * m + 2) // 5 + 1
+
+
+def day_number(year, month, day, calendar=None):
+    if calendar is None:
+        number = _day_number(year, month, day, "Julian")
+        if reform_calendar(number) == "Julian":
+            calendar = "Julian"
+        else:
+            number = _day_number(year, month, day, "Gregorian")
+            calendar = "Gregorian" if reform_calendar(number) == "Gregorian" else None
+    elif calendar not in CALENDARS:
+        raise ValueError(f"Unknown calendar: {calendar}")
+    else:
+        number = _day_number(year, month, day, calendar)
+    if calendar is None or calendar_date(number, calendar) != (year, month, day):
+        raise ValueError(f"Invalid date: {year}-{month}-{day}")
+    return number
+
+
+def calendar_dates(number):
+    return {i: list(calendar_date(number, i)) for i in CALENDARS}
+
+
+def julday(year, month, day, hour, minute, latitude, longitude, calendar=None, zone=None, dst=False):
+    year, month, day = calendar_date(day_number(year, month, day, calendar), "Gregorian")
+    zone, offset = timezones.utc_offset(year, month, day, hour, minute, latitude, longitude, zone, dst)
+    jd = swe.julday(year, month, day, hour + minute / 60 - offset)
+    return round(jd + cached_deltat(jd), 6)
+
+
+def calc_ut(jd, planet, flags=FLAGS):
+    result = swe.calc_ut(jd, planet, flags)
+    # pyswisseph >= 2.08 returns (xx, retflags), older releases return xx only.
+    if isinstance(result[0], tuple):
+        return result[0]
+    return result
+
+
+def cached_calc_ut(jd, planet, flags=FLAGS):
+    return EPHEMERIS_CACHE.call(("calc_ut", jd, planet, flags), calc_ut, jd, planet, flags)[0]
+
+
+def cached_deltat(jd):
+    return EPHEMERIS_CACHE.call(("deltat", jd), swe.deltat, jd)[0]
+
+
+class Cancelled(Exception):
+    pass
+
+
+class ChartData:
+    def __init__(self, year, month, day, hour, minute, longitude, latitude, dst=False, orbs=None, profile=None,
+                 midpoint_from=(), midpoint_to=(), house_system="P", cache=None, calendar=None, zone=None,
+                 cancel=None):
+        ensure_ephe_path()
+        self.cancel = cancel
+        self.calendar = calendar
+        self.day_number = day_number(year, month, day, calendar)
+        self.year = year
+        self.month = month
+        self.day = day
+        self.hour = hour
+        self.minute = minute
+        self.longitude = longitude
+        self.latitude = latitude
+        self.house_system = house_system
+        self.calender_variables = calendar_dates(self.day_number)
+        self.zone, self.utc_offset = timezones.utc_offset(*self.calender_variables["Gregorian"], hour, minute,
+                                                          latitude, longitude, zone, dst)
+        self.base_profile = profile or DEFAULT_PROFILE
+        self.orbs = dict(orbs or {})
+        self.profile = self.base_profile.with_orbs(self.orbs) if self.orbs else self.base_profile
+        self.swe_calls = 0
+        self._cache = {}
+        self.jd = self.julday()
+        self.cache = cache
+        self.cache_record = None
+        self.cache_changed = False
+        if cache is not None:
+            self.load_cache()
+        self.compute()
+        if self.cache_changed:
+            self.store_cache()
+        self.check_cancel()
+        self.find_midpoints(midpoint_from, midpoint_to)
+        self.cancel = None
+
+    def check_cancel(self):
+        # A chart that nobody waits for any more stops at the next stage instead of running to the end.
+        if self.cancel is not None and self.cancel.is_set():
+            raise Cancelled
+
+    def memoize(self, key, function, *args, shared_key=None):
+        try:
+            return self._cache[key]
+        except KeyError:
+            self.check_cancel()
+            if shared_key is None:
+                value, computed = function(*args), True
+            else:
+                value, computed = EPHEMERIS_CACHE.call(shared_key, function, *args)
+            self.swe_calls += computed
+            self._cache[key] = value
+            return value
+
+    def compute(self):
+        self.cusps, self.asc, self.mc = self.house_cusps()
+        self.positions = {key: self.planet_pos(value) for key, value in PLANETS.items()}
+        self.records = {key: Position(*value[:4], cusps=self.cusps) for key, value in self.positions.items()}
+        self.records["Asc"] = Position(self.asc, cusps=self.cusps)
+        self.records["Mc"] = Position(self.mc, cusps=self.cusps)
+        self.degrees = {key: value.longitude for key, value in self.records.items()}
+        self.check_cancel()
+        self.aspects = self.find_aspects()
+
+    def shifted(self, days):
+        ensure_ephe_path()
+        frame = copy.copy(self)
+        ut = self.day_number * 1440 + self.hour * 60 + self.minute - round(self.utc_offset * 60) + round(days * 1440)
+        year, month, day = calendar_date(ut // 1440, "Gregorian")
+        frame.utc_offset = timezones.universal_offset(self.zone, year, month, day, *divmod(ut % 1440, 60),
+                                                      self.longitude)
+        frame.day_number, minutes = divmod(ut + round(frame.utc_offset * 60), 1440)
+        frame.year, frame.month, frame.day = calendar_date(frame.day_number, self.calendar)
+        frame.hour, frame.minute = divmod(minutes, 60)
+        frame.calender_variables = calendar_dates(frame.day_number)
+        frame.jd = self.jd + days
+        frame.swe_calls = 0
+        frame._cache = {}
+        frame.cache = None
+        frame.cache_record = None
+        frame.cache_changed = False
+        frame.compute()
+        frame.find_midpoints(self.midpoint_from, self.midpoint_to)
+        return frame
+
+    def julday(self):
+        year, month, day = self.calender_variables["Gregorian"]
+        jd = self.memoize("julday", swe.julday, year, month, day,
+                          self.hour + self.minute / 60 - self.utc_offset)
+        deltat = self.memoize("deltat", swe.deltat, jd, shared_key=("deltat", jd))
+        return round(jd + deltat, 6)
+
+    def house_cusps(self):
+        cusps, ascmc = self.memoize("houses", swe.houses, self.jd, self.latitude, self.longitude,
+                                    self.house_system.encode())
+        return list(cusps[:12]), ascmc[0], ascmc[1]
+
+    def planet_pos(self, planet):
+        jd = self.jd
+        return self.memoize(("calc_ut", planet), calc_ut, jd, planet, FLAGS, shared_key=("calc_ut", jd, planet, FLAGS))
+
+    def load_cache(self):
+        self.cache_key = self.cache.key(self.jd, self.latitude, self.longitude, self.house_system, PLANETS)
+        record = self.cache.get(self.cache_key)
+        if record is None:
+            self.cache_record = {"houses": None, "positions": {}, "aspects": {}}
+            self.cache_changed = True
+            return
+        self.cache_record = record
+        cusps, ascmc = record["houses"]
+        self._cache["houses"] = tuple(cusps), tuple(ascmc)
+        for key, value in record["positions"].items():
+            self._cache["calc_ut", int(key)] = tuple(value)
+
+    def store_cache(self):
+        self.cache_record["houses"] = [list(i) for i in self._cache["houses"]]
+        self.cache_record["positions"] = {value: list(self.positions[key]) for key, value in PLANETS.items()}
+        self.cache.put(self.cache_key, self.cache_record)
+        self.cache_changed = False
+
+    def find_aspects(self):
+        if self.cache_record is not None:
+            fingerprint = self.profile.fingerprint
+            if fingerprint in self.cache_record["aspects"]:
+                self.aspect_table = aspects.AspectTable.from_dict(self.cache_record["aspects"][fingerprint])
+            else:
+                self.aspect_table = self.aspects_for(self.profile)
+                self.cache_record["aspects"][fingerprint] = self.aspect_table.to_dict()
+                self.cache_changed = True
+        else:
+            self.aspect_table = self.aspects_for(self.profile)
+        return list(self.aspect_table.rows(list(self.degrees.keys())))
+
+    def aspects_for(self, profile):
+        speeds = [value[3] for value in self.positions.values()] + [0.0] * len(ANGLES)
+        return aspects.find_aspects(list(self.degrees.values()), profile=profile, speeds=speeds,
+                                    bodies=list(self.degrees.keys()))
+
+    def set_orbs(self, orbs):
+        self.orbs = dict(orbs or {})
+        self.profile = self.base_profile.with_orbs(self.orbs) if self.orbs else self.base_profile
+        self.aspects = self.find_aspects()
+        if self.cache_changed:
+            self.store_cache()
+        self.find_midpoints(self.midpoint_from, self.midpoint_to)
+
+    def find_midpoints(self, midpoint_from, midpoint_to):
+        self.midpoint_from = tuple(midpoint_from)
+        self.midpoint_to = tuple(midpoint_to)
+        self.midpoints = {}
+        self.midpoint_aspects = []
+        if not midpoint_from or not midpoint_to:
+            return
+        self.midpoint_index = MidpointIndex(self.degrees)
+        keys = {}
+        for i in range(len(self.midpoint_index)):
+            key, _key = self.midpoint_index.pair(i)
+            if key in midpoint_from or _key in midpoint_from:
+                if key not in midpoint_from:
+                    key, _key = _key, key
+                keys[frozenset((key, _key))] = key, _key
+                self.midpoints[key, _key] = self.midpoint_index.midpoints[i]
+        for i, aspect, pair in self.midpoint_index.aspects(midpoint_to, profile=self.profile, include=midpoint_from):
+            self.midpoint_aspects.append((i, aspect, keys[frozenset(pair)]))
+
+
+class FrameBuffer:
+    def __init__(self, data, step, size=32, executor=None):
+        self.data = data
+        self.step = step
+        self.size = size
+        self.executor = executor or ThreadPoolExecutor(max_workers=1)
+        self.frames = deque()
+        self.count = 0
+        self.fill()
+
+    def fill(self):
+        while len(self.frames) < self.size:
+            self.count += 1
+            self.frames.append(self.executor.submit(self.data.shifted, self.count * self.step))
+
+    def ready(self):
+        return bool(self.frames) and self.frames[0].done()
+
+    def next(self):
+        frame = self.frames.popleft().result()
+        self.fill()
+        return frame
+
+    def cancel(self):
+        for i in self.frames:
+            i.cancel()
+        self.frames.clear()
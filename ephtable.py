@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+import json
+import os
+
+import numpy as np
+from numpy.polynomial import chebyshev
+import swisseph as swe
+import engine
+
+DEGREE = 13
+
+SEGMENTS = {
+    swe.SUN: 16,
+    swe.MOON: 4,
+    swe.MERCURY: 8,
+    swe.VENUS: 16,
+    swe.MARS: 16,
+    swe.JUPITER: 16,
+    swe.SATURN: 16,
+    swe.URANUS: 16,
+    swe.NEPTUNE: 16,
+    swe.PLUTO: 16,
+    swe.TRUE_NODE: 2,
+    swe.CHIRON: 16,
+}
+
+
+def build_body(planet, jd_start, jd_end, segment, degree=DEGREE, dtype=np.float64):
+    count = int(np.ceil((jd_end - jd_start) / segment))
+    nodes = np.cos(np.pi * (np.arange(degree + 1) + 0.5) / (degree + 1))
+    coefficients = np.empty((count, 2, degree + 1), dtype=dtype)
+    for i in range(count):
+        start = jd_start + i * segment
+        samples = np.array([engine.calc_ut(start + (x + 1) * segment / 2, planet)[:2] for x in nodes])
+        longitude = np.degrees(np.unwrap(np.radians(samples[:, 0])))
+        coefficients[i, 0] = chebyshev.chebfit(nodes, longitude, degree)
+        coefficients[i, 1] = chebyshev.chebfit(nodes, samples[:, 1], degree)
+    return coefficients
+
+
+def build(path, jd_start, jd_end, planets=None, degree=DEGREE, dtype=np.float64):
+    engine.ensure_ephe_path()
+    if planets is None:
+        planets = engine.PLANETS
+    os.makedirs(path, exist_ok=True)
+    meta = {"jd_start": jd_start, "jd_end": jd_end, "degree": degree, "bodies": {}}
+    for name, planet in planets.items():
+        segment = SEGMENTS.get(planet, 16)
+        file = f"{planet}.npy"
+        np.save(os.path.join(path, file), build_body(planet, jd_start, jd_end, segment, degree, dtype))
+        meta["bodies"][name] = {"id": planet, "segment": segment, "file": file}
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=4)
+    return EphemerisTable(path)
+
+
+def clenshaw(coefficients, x):
+    b1 = np.zeros_like(x)
+    b2 = np.zeros_like(x)
+    for i in range(coefficients.shape[-1] - 1, 0, -1):
+        b1, b2 = 2 * x * b1 - b2 + coefficients[..., i], b1
+    return x * b1 - b2 + coefficients[..., 0]
+
+
+class EphemerisTable:
+    def __init__(self, path):
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.path = path
+        self.jd_start = meta["jd_start"]
+        self.jd_end = meta["jd_end"]
+        self.degree = meta["degree"]
+        self.bodies = {}
+        self.segments = {}
+        self.coefficients = {}
+        for name, body in meta["bodies"].items():
+            self.bodies[name] = body["id"]
+            self.segments[body["id"]] = body["segment"]
+            self.coefficients[body["id"]] = np.load(os.path.join(path, body["file"]), mmap_mode="r")
+
+    def __contains__(self, planet):
+        return planet in self.coefficients
+
+    def lookup(self, jd, planet):
+        jd = np.asarray(jd, dtype=np.float64)
+        if np.any(jd < self.jd_start) or np.any(jd > self.jd_end):
+            raise ValueError(f"jd outside the table range {self.jd_start} - {self.jd_end}")
+        segment = self.segments[planet]
+        coefficients = self.coefficients[planet]
+        index = np.minimum(((jd - self.jd_start) // segment).astype(np.int64), len(coefficients) - 1)
+        x = 2 * (jd - self.jd_start - index * segment) / segment - 1
+        c = np.asarray(coefficients[index], dtype=np.float64)
+        longitude = clenshaw(c[..., 0, :], x) % 360
+        latitude = clenshaw(c[..., 1, :], x)
+        speed = clenshaw(chebyshev.chebder(c[..., 0, :], axis=-1), x) * 2 / segment
+        return longitude, latitude, speed
+
+    def position(self, jd, planet):
+        longitude, latitude, speed = self.lookup(jd, planet)
+        return float(longitude), float(speed)
+
+    def max_error(self, planet, samples=10000, seed=0):
+        engine.ensure_ephe_path()
+        jd = np.random.default_rng(seed).uniform(self.jd_start, self.jd_end, samples)
+        longitude, latitude, speed = self.lookup(jd, planet)
+        exact = np.array([engine.calc_ut(i, planet)[:4] for i in jd])
+        return {
+            "longitude": float(np.max(np.abs((longitude - exact[:, 0] + 180) % 360 - 180))),
+            "latitude": float(np.max(np.abs(latitude - exact[:, 1]))),
+            "speed": float(np.max(np.abs(speed - exact[:, 3])))
+        }
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import batch
+from aspects import COLUMNS, AspectTable
+
+POSITION_FIELDS = "longitude", "latitude", "distance", "speed"
+
+HOUSES = tuple(f"House {i}" for i in range(1, 13))
+
+
+def chunks(results):
+    if isinstance(results, batch.BatchResult):
+        return [(0, results)]
+    return results
+
+
+def chart_columns(result, offset=0):
+    columns = {"chart": np.arange(offset, offset + len(result), dtype=np.int64), "jd": result.jd}
+    for i, name in enumerate(result.planets):
+        for j, field in enumerate(POSITION_FIELDS):
+            columns[f"{name} {field}"] = result.positions[:, i, j]
+    columns["Asc"] = result.asc
+    columns["Mc"] = result.mc
+    for i, name in enumerate(HOUSES):
+        columns[name] = result.cusps[:, i]
+    return columns
+
+
+def aspect_columns(result, offset=0):
+    table = result.aspects
+    columns = {i: getattr(table, i) for i in COLUMNS if getattr(table, i) is not None}
+    columns["chart"] = table.chart + offset
+    return columns
+
+
+def save_npz(path, results, compressed=True):
+    # Unordered runs deliver chunks as they finish; the arrays are stored in chart order.
+    parts = sorted(chunks(results), key=lambda part: part[0])
+    if not parts:
+        raise ValueError("No results to export")
+    first = parts[0][1]
+    tables = [aspect_columns(result, offset) for offset, result in parts]
+    arrays = {
+        "bodies": np.array(first.bodies),
+        "planets": np.array(first.planets),
+        "aspect_names": np.array(first.aspects.names),
+        "jd": np.concatenate([i.jd for _, i in parts]),
+        "positions": np.concatenate([i.positions for _, i in parts]),
+        "cusps": np.concatenate([i.cusps for _, i in parts]),
+        "asc": np.concatenate([i.asc for _, i in parts]),
+        "mc": np.concatenate([i.mc for _, i in parts])
+    }
+    for name in tables[0]:
+        if all(name in i for i in tables):
+            arrays[f"aspect_{name}"] = np.concatenate([i[name] for i in tables])
+    (np.savez_compressed if compressed else np.savez)(path, **arrays)
+
+
+def load_npz(path):
+    with np.load(path) as arrays:
+        result = batch.BatchResult(len(arrays["jd"]), arrays["planets"].tolist())
+        result.jd = arrays["jd"]
+        result.positions = arrays["positions"]
+        result.cusps = arrays["cusps"]
+        result.asc = arrays["asc"]
+        result.mc = arrays["mc"]
+        result.aspects = AspectTable(
+            names=tuple(arrays["aspect_names"].tolist()),
+            **{i: arrays[f"aspect_{i}"] for i in COLUMNS if f"aspect_{i}" in arrays.files})
+    return result
+
+
+class ParquetWriter:
+    def __init__(self, path, aspects_path=None, compression="zstd"):
+        import pyarrow
+        import pyarrow.parquet
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.aspects_path = aspects_path
+        self.compression = compression
+        self.charts = None
+        self.aspects = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def chart_table(self, result, offset):
+        return self.pa.table(chart_columns(result, offset))
+
+    def aspect_table(self, result, offset):
+        columns = aspect_columns(result, offset)
+        bodies = self.pa.array(result.bodies)
+        for name in ("body_a", "body_b"):
+            columns[name] = self.pa.DictionaryArray.from_arrays(columns[name], bodies)
+        columns["aspect"] = self.pa.DictionaryArray.from_arrays(columns["aspect"], self.pa.array(result.aspects.names))
+        return self.pa.table(columns)
+
+    def write(self, result, offset=0):
+        table = self.chart_table(result, offset)
+        if self.charts is None:
+            self.charts = self.pq.ParquetWriter(self.path, table.schema, compression=self.compression)
+        self.charts.write_table(table)
+        if self.aspects_path is None or result.aspects is None:
+            return
+        table = self.aspect_table(result, offset)
+        if self.aspects is None:
+            self.aspects = self.pq.ParquetWriter(self.aspects_path, table.schema, compression=self.compression)
+        self.aspects.write_table(table)
+
+    def close(self):
+        for writer in (self.charts, self.aspects):
+            if writer is not None:
+                writer.close()
+        self.charts = self.aspects = None
+
+
+def save_parquet(path, results, aspects_path=None, compression="zstd"):
+    with ParquetWriter(path, aspects_path=aspects_path, compression=compression) as writer:
+        for offset, result in chunks(results):
+            writer.write(result, offset)
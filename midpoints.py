@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from aspects import DEFAULT_PROFILE, aspect_points, pairs
+
+DIALS = 360, 90, 45
+
+
+def midpoints(degrees, a, b):
+    diff = (degrees[b] - degrees[a]) % 360
+    near = np.where(diff > 180, degrees[b], degrees[a])
+    return (near + np.where(diff > 180, 360 - diff, diff) / 2) % 360
+
+
+def distance(degree1, degree2, dial=360):
+    diff = np.abs(degree1 - degree2) % dial
+    return np.minimum(diff, dial - diff)
+
+
+class MidpointIndex:
+    def __init__(self, degrees, bodies=None, dial=360):
+        if dial not in DIALS:
+            raise ValueError(f"dial must be one of {DIALS}")
+        if isinstance(degrees, dict):
+            bodies = list(degrees.keys())
+            degrees = list(degrees.values())
+        self.bodies = list(bodies)
+        self.degrees = np.asarray(degrees, dtype=np.float64)
+        self.dial = dial
+        a, b = pairs(len(self.degrees))
+        folded = midpoints(self.degrees, a, b) % dial
+        order = np.argsort(folded, kind="stable")
+        self.a = a[order]
+        self.b = b[order]
+        self.midpoints = midpoints(self.degrees, self.a, self.b)
+        self.folded = folded[order]
+
+    def __len__(self):
+        return len(self.folded)
+
+    def pair(self, i):
+        return self.bodies[self.a[i]], self.bodies[self.b[i]]
+
+    def window(self, center, orb):
+        if 2 * orb >= self.dial:
+            return np.arange(len(self))
+        low = (center - orb) % self.dial
+        high = (center + orb) % self.dial
+        i = np.searchsorted(self.folded, low, side="right")
+        j = np.searchsorted(self.folded, high, side="left")
+        if low <= high:
+            return np.arange(i, j)
+        return np.concatenate([np.arange(i, len(self)), np.arange(0, j)])
+
+    def within(self, degree, orb, exclude=None):
+        index = self.window(degree % self.dial, orb)
+        orbs = distance(degree, self.folded[index], self.dial)
+        keep = orbs < orb
+        if exclude is not None:
+            keep &= (self.a[index] != exclude) & (self.b[index] != exclude)
+        index = index[keep]
+        order = np.argsort(orbs[keep], kind="stable")
+        return index[order], orbs[keep][order]
+
+    def tree(self, body, orb):
+        body = self.bodies.index(body)
+        index, orbs = self.within(self.degrees[body], orb, exclude=body)
+        return [(self.pair(i), float(self.midpoints[i]), float(j)) for i, j in zip(index, orbs)]
+
+    def aspects(self, targets, profile=None, include=None):
+        if profile is None:
+            profile = DEFAULT_PROFILE
+        found = []
+        for target in targets:
+            degree = self.degrees[self.bodies.index(target)]
+            factor = profile.factors([target])[0]
+            seen = set()
+            for k, (angle, orb) in enumerate(zip(profile.angles, profile.orbs * factor)):
+                for center in aspect_points(degree, angle):
+                    for i in self.window(center % self.dial, orb):
+                        if i in seen:
+                            continue
+                        separation = distance(degree, self.midpoints[i])
+                        if abs(separation - angle) < orb and (angle > 0 or separation > 0):
+                            pair = self.pair(i)
+                            if include is None or pair[0] in include or pair[1] in include:
+                                seen.add(i)
+                                found.append((target, profile.names[k], pair))
+        return found
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+
+import numpy as np
+import batch
+import engine
+
+
+def init_worker(ephe_path):
+    engine.set_ephe_path(ephe_path)
+
+
+def run_chunk(offset, records, dst, orbs, planets, profile, calendar=None, house_system="P"):
+    start = time.perf_counter()
+    result = batch.compute_batch(records, dst=dst, orbs=orbs, planets=planets, profile=profile, calendar=calendar,
+                                 house_system=house_system)
+    return offset, os.getpid(), time.perf_counter() - start, result
+
+
+def chunks(records, chunk_size):
+    if isinstance(records, np.ndarray):
+        for offset in range(0, len(records), chunk_size):
+            yield offset, records[offset:offset + chunk_size]
+        return
+    records = iter(records)
+    offset = 0
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+
+class WorkerStats:
+    def __init__(self, pid):
+        self.pid = pid
+        self.chunks = 0
+        self.charts = 0
+        self.seconds = 0.0
+
+    @property
+    def throughput(self):
+        if self.seconds == 0:
+            return 0.0
+        return self.charts / self.seconds
+
+    def __repr__(self):
+        return f"WorkerStats(pid={self.pid}, chunks={self.chunks}, charts={self.charts}, " \
+               f"throughput={self.throughput:.1f}/s)"
+
+
+class BatchRunner:
+    def __init__(self, workers=None, chunk_size=1000, ordered=True, ephe_path=None, dst=False, orbs=None,
+                 planets=None, profile=None, calendar=None, house_system="P"):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.ordered = ordered
+        self.ephe_path = ephe_path or engine.default_ephe_path()
+        self.dst = dst
+        self.orbs = orbs
+        self.planets = planets
+        self.profile = profile
+        self.calendar = calendar
+        self.house_system = house_system
+        self.stats = {}
+        self.charts = 0
+        self.seconds = 0.0
+        self.executor = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def start(self):
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=init_worker, initargs=(self.ephe_path,))
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    @property
+    def throughput(self):
+        if self.seconds == 0:
+            return 0.0
+        return self.charts / self.seconds
+
+    def record(self, pid, seconds, result):
+        stats = self.stats.setdefault(pid, WorkerStats(pid))
+        stats.chunks += 1
+        stats.charts += len(result)
+        stats.seconds += seconds
+
+    def run(self, records):
+        self.start()
+        start = time.perf_counter()
+        pending = set()
+        done = {}
+        next_offset = 0
+        source = chunks(records, self.chunk_size)
+        exhausted = False
+        while True:
+            # Finished chunks waiting for a slow head chunk count too, or they would pile up without bound.
+            while not exhausted and len(pending) + len(done) < self.workers * 2:
+                try:
+                    offset, chunk = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(self.executor.submit(
+                    run_chunk, offset, chunk, self.dst, self.orbs, self.planets, self.profile, self.calendar,
+                    self.house_system))
+            if not pending:
+                break
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                offset, pid, seconds, result = future.result()
+                self.record(pid, seconds, result)
+                self.charts += len(result)
+                if self.ordered:
+                    done[offset] = result
+                else:
+                    yield offset, result
+            self.seconds = time.perf_counter() - start
+            while next_offset in done:
+                result = done.pop(next_offset)
+                yield next_offset, result
+                next_offset += len(result)
+
+
+def compute_parallel(records, workers=None, chunk_size=1000, ordered=True, **kwargs):
+    with BatchRunner(workers=workers, chunk_size=chunk_size, ordered=ordered, **kwargs) as runner:
+        yield from runner.run(records)
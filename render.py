@@ -0,0 +1,622 @@
+# -*- coding: utf-8 -*-
+
+import os
+from functools import lru_cache
+from html import escape
+from math import cos, sin, radians
+
+import numpy as np
+import engine
+
+WIDTH = 1270
+HEIGHT = 660
+CENTER = 550, 350
+
+GLYPH_RADIUS = 192.5
+GLYPH_SPACING = 24
+LEADER_THRESHOLD = 0.5
+
+ANGULAR_HOUSES = [0, 3, 6, 9]
+OTHER_HOUSES = [1, 2, 4, 5, 7, 8, 10, 11]
+
+# Every sign boundary (even rows) and sign middle (odd rows) from 0 Aries, rotated per chart.
+SIGN_TRIG = np.column_stack([np.cos(np.radians(np.arange(24) * 15.0)), np.sin(np.radians(np.arange(24) * 15.0))])
+
+ASPECT_SYMBOLS = {
+    "Conjunction": "\u260C",
+    "Semi-Sextile": "\u26BA",
+    "Semi-Square": "\u2220",
+    "Sextile": "\u26B9",
+    "Quintile": "Q",
+    "Square": "\u25A1",
+    "Trine": "\u25B3",
+    "Sesquiquadrate": "\u26BC",
+    "BiQuintile": "bQ",
+    "Quincunx": "\u26BB",
+    "Opposite": "\u260D",
+}
+
+ASPECT_COLORS = {
+    "Conjunction": "red",
+    "Semi-Sextile": "black",
+    "Semi-Square": "black",
+    "Sextile": "blue",
+    "Quintile": "purple",
+    "Square": "red",
+    "Trine": "blue",
+    "Sesquiquadrate": "orange",
+    "BiQuintile": "gray",
+    "Quincunx": "pink",
+    "Opposite": "red",
+}
+
+LAYERS = {
+    "wheel": ["draw_oval_object", "draw_line_object", "draw_houses", "draw_signs", "draw_house_numbers",
+              "draw_sign_symbols"],
+    "planets": ["draw_planets"],
+    "aspects": ["draw_aspects"],
+    "tables": ["parse_positions", "parse_aspects", "draw_house_info", "draw_planet_info", "draw_aspect_info",
+               "draw_chart_info"],
+    "midpoints": ["draw_midpoints"],
+}
+
+
+def unit_vectors(angles):
+    angles = np.radians(np.asarray(angles, dtype=np.float64))
+    return np.column_stack([np.cos(angles), np.sin(angles)])
+
+
+def rotate(vectors, angle):
+    c, s = cos(radians(angle)), sin(radians(angle))
+    return np.column_stack([vectors[:, 0] * c - vectors[:, 1] * s, vectors[:, 1] * c + vectors[:, 0] * s])
+
+
+def points(vectors, r):
+    return np.column_stack([CENTER[0] + r * vectors[:, 0], CENTER[1] - r * vectors[:, 1]])
+
+
+def segments(vectors, r1, r2):
+    return np.hstack([points(vectors, r1), points(vectors, r2)])
+
+
+def merge_clusters(clusters, gap):
+    merged = []
+    for total, count in clusters:
+        while merged:
+            _total, _count = merged[-1]
+            if total / count - (count - 1) * gap / 2 - (_total / _count + (_count - 1) * gap / 2) >= gap:
+                break
+            merged.pop()
+            total, count = total + _total, count + _count
+        merged.append((total, count))
+    return merged
+
+
+def spread(angles, gap):
+    angles = np.asarray(angles, dtype=np.float64) % 360
+    n = len(angles)
+    if n < 2:
+        return angles
+    gap = min(gap, 360 / n)
+    order = np.argsort(angles)
+    ordered = angles[order]
+    # Cut the circle at its widest empty arc, so the sweep runs along a line.
+    start = np.argmax(np.diff(np.append(ordered, ordered[0] + 360))) + 1
+    order = np.roll(order, -start)
+    ordered = np.concatenate([ordered[start:], ordered[:start] + 360]) if start < n else ordered
+    clusters = merge_clusters([(i, 1) for i in ordered.tolist()], gap)
+    # Clusters that grew into each other across the cut are merged and swept again.
+    while len(clusters) > 1:
+        (total, count), (_total, _count) = clusters[0], clusters[-1]
+        if total / count - (count - 1) * gap / 2 + 360 - (_total / _count + (_count - 1) * gap / 2) >= gap:
+            break
+        order = np.roll(order, _count)
+        clusters = merge_clusters([(total + _total - 360 * _count, count + _count)] + clusters[1:-1], gap)
+    placed = np.concatenate([total / count + (np.arange(count) - (count - 1) / 2) * gap for total, count in clusters])
+    result = np.empty(n)
+    result[order] = placed % 360
+    return result
+
+
+class Layout:
+    def __init__(self, wheel):
+        self.bodies = list(wheel.PLANET_DEGREES)
+        self.index = {j: i for i, j in enumerate(self.bodies)}
+        signs = rotate(SIGN_TRIG, 180 - wheel.data.asc)
+        cusps = np.array(wheel.MIDPOINT_OF_HOUSES)
+        bodies = unit_vectors(list(wheel.PLANET_DEGREES.values()))
+        self.house_lines = segments(unit_vectors(cusps), 60, 210)
+        self.house_numbers = points(unit_vectors(cusps + ((np.roll(cusps, -1) - cusps) % 360) / 2), 85)
+        self.sign_lines = segments(signs[0::2], 210, 260)
+        self.sign_symbols = points(signs[1::2], 235)
+        self.planet_ticks = segments(bodies, 210, 205)
+        self.glyph_angles = spread(list(wheel.PLANET_DEGREES.values()), np.degrees(GLYPH_SPACING / GLYPH_RADIUS))
+        glyphs = unit_vectors(self.glyph_angles)
+        self.glyphs = points(glyphs, GLYPH_RADIUS)
+        moved = np.abs((self.glyph_angles - list(wheel.PLANET_DEGREES.values()) + 180) % 360 - 180) > LEADER_THRESHOLD
+        self.leaders = np.hstack([points(bodies[moved], 205), points(glyphs[moved], 205 - GLYPH_SPACING / 4)])
+        self.chords = points(bodies, 165)
+
+    def aspect_chords(self, pairs):
+        a = [self.index[i] for i, j in pairs]
+        b = [self.index[j] for i, j in pairs]
+        return np.hstack([self.chords[a], self.chords[b]])
+
+    def midpoint_chords(self, angles, targets):
+        return np.hstack([self.chords[[self.index[i] for i in targets]], points(unit_vectors(angles), 165)])
+
+
+class TkBackend:
+    def __init__(self, canvas):
+        self.canvas = canvas
+
+    def oval_object(self, x, y, r, dash=True, tags=()):
+        if dash is True:
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill="white", width=2, dash=(1, 10), tags=tags)
+        else:
+            self.canvas.create_oval(x - r, y - r, x + r, y + r, fill="white", width=2, tags=tags)
+
+    def line_object(self, x1, y1, x2, y2, width=2, fill="black", tags=()):
+        return self.canvas.create_line(x1, y1, x2, y2, width=width, fill=fill, tags=tags)
+
+    def line_objects(self, lines, width=2, fill="black", tags=()):
+        create_line = self.canvas.create_line
+        return [create_line(x1, y1, x2, y2, width=width, fill=fill, tags=tags)
+                for x1, y1, x2, y2 in np.asarray(lines).tolist()]
+
+    def text_object(self, x, y, _text, width=0, font="Arial", fill="black", tags=()):
+        return self.canvas.create_text(x, y, text=_text, width=width, font=font, fill=fill, tags=tags)
+
+    def delete(self, tag):
+        self.canvas.delete(tag)
+
+    def move(self, items, coordinates):
+        coords = self.canvas.coords
+        for item, i in zip(items, np.asarray(coordinates).tolist()):
+            coords(item, *i)
+
+
+@lru_cache(maxsize=None)
+def font_parts(font):
+    family, _, size = font.partition(" ")
+    return family, int(size) if size else 10
+
+
+class SvgBackend:
+    def __init__(self, width=WIDTH, height=HEIGHT, background="white"):
+        self.width = width
+        self.height = height
+        self.items = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">',
+            f'<rect width="{width}" height="{height}" fill="{background}"/>'
+        ]
+
+    def oval_object(self, x, y, r, dash=True, tags=()):
+        dash = ' stroke-dasharray="1 10"' if dash is True else ""
+        self.items.append(
+            f'<circle cx="{x:.2f}" cy="{y:.2f}" r="{r}" fill="white" stroke="black" stroke-width="2"{dash}/>')
+
+    def line_object(self, x1, y1, x2, y2, width=2, fill="black", tags=()):
+        self.items.append(
+            f'<line x1="{x1:.2f}" y1="{y1:.2f}" x2="{x2:.2f}" y2="{y2:.2f}" stroke="{fill}" stroke-width="{width}"/>')
+
+    def line_objects(self, lines, width=2, fill="black", tags=()):
+        if len(lines):
+            path = "".join("M%.2f %.2fL%.2f %.2f" % tuple(i) for i in np.asarray(lines).tolist())
+            self.items.append(f'<path d="{path}" stroke="{fill}" stroke-width="{width}"/>')
+        return []
+
+    def text_object(self, x, y, _text, width=0, font="Arial", fill="black", tags=()):
+        family, size = font_parts(font)
+        # Tk font sizes are points; Tk centers the whole block of lines on (x, y) and left-justifies them.
+        px = size * 4 / 3
+        _text = str(_text)
+        if "\n" not in _text:
+            self.items.append(
+                f'<text x="{x:.2f}" y="{y + px * 0.35:.2f}" font-family="{family}" font-size="{size}pt" '
+                f'fill="{fill}" text-anchor="middle">{escape(_text)}</text>')
+            return
+        lines = _text.split("\n")
+        top = y - len(lines) * px * 0.6
+        x -= max(len(i) for i in lines) * px * 0.3
+        spans = "".join(
+            f'<tspan x="{x:.2f}" y="{top + (i + 0.5) * px * 1.2 + px * 0.35:.2f}">{escape(j)}</tspan>'
+            for i, j in enumerate(lines) if j
+        )
+        self.items.append(
+            f'<text font-family="{family}" font-size="{size}pt" fill="{fill}">{spans}</text>')
+
+    def document(self):
+        return "\n".join(self.items) + "\n</svg>\n"
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.document())
+
+    def png(self, path=None):
+        import cairosvg
+        return cairosvg.svg2png(bytestring=self.document().encode("utf-8"), write_to=path)
+
+
+class Wheel:
+    def __init__(self, data, enabled_aspects=(), midpoint=False, backend=None):
+        self.data = data
+        self.midpoint = midpoint
+        self.enabled_aspects = list(enabled_aspects)
+        self.backend = backend if backend is not None else SvgBackend()
+        self.SIGNS = engine.SIGNS
+        self.SIGN_SYMBOLS = ["\u2648", "\u2649", "\u264A", "\u264B", "\u264C", "\u264D",
+                             "\u264E", "\u264F", "\u2650", "\u2651", "\u2652", "\u2653"]
+        self.SIGN_COLORS = ["red", "green", "yellow", "blue"] * 3
+        self._SIGN_SYMBOLS = {i: j for i, j in zip(self.SIGNS, self.SIGN_SYMBOLS)}
+        self._SIGN_COLORS = {i: j for i, j in zip(self.SIGNS, self.SIGN_COLORS)}
+        self.PLANETS = list(self.data.degrees.keys())
+        self.PLANET_SYMBOLS = {
+            "Sun": "\u2299",
+            "Moon": "\u263E",
+            "Mercury": "\u263F",
+            "Venus": "\u2640",
+            "Mars": "\u2642",
+            "Jupiter": "\u2643",
+            "Saturn": "\u2644",
+            "Uranus": "\u2645",
+            "Neptune": "\u2646",
+            "Pluto": "\u2647",
+            "North Node": "\u260A",
+            "Chiron": "\u26B7",
+            "Asc": "Asc",
+            "Mc": "Mc"
+        }
+        self.ASPECT_SYMBOLS = dict(ASPECT_SYMBOLS)
+        self.ASPECT_SYMBOLS["Null"] = " "
+        self.ASPECTS = {}
+        self.PLANET_INFO_FORMAT = []
+        self.HOUSE_INFO_FORMAT = []
+        self.tags = ()
+        self.items = {}
+        self.place()
+
+    def place(self):
+        self.PLANET_DEGREES = {key: self.wheel_angle(value) for key, value in self.data.degrees.items()}
+        self.MIDPOINT_OF_HOUSES = [self.wheel_angle(i) for i in self.data.cusps]
+        self.layout = Layout(self)
+
+    def draw(self):
+        for layer in LAYERS:
+            self.draw_layer(layer)
+        return self.backend
+
+    def draw_layer(self, layer):
+        self.tags = (layer,)
+        for method in LAYERS[layer]:
+            getattr(self, method)()
+
+    def redraw(self, *layers):
+        for layer in LAYERS:
+            if layer in layers:
+                self.backend.delete(layer)
+                self.draw_layer(layer)
+
+    def set_aspects(self, enabled_aspects):
+        enabled_aspects = list(enabled_aspects)
+        for aspect in self.enabled_aspects:
+            if aspect not in enabled_aspects:
+                self.backend.delete(f"aspect-{aspect}")
+        added = [i for i in enabled_aspects if i not in self.enabled_aspects]
+        self.enabled_aspects = enabled_aspects
+        self.tags = ("aspects",)
+        self.draw_aspects(added)
+
+    def update(self, enabled_aspects, orbs=None, midpoint=False, midpoint_from=(), midpoint_to=()):
+        layers = set()
+        if dict(orbs or {}) != self.data.orbs:
+            self.data.set_orbs(orbs)
+            layers.update(("aspects", "tables", "midpoints"))
+        if not midpoint:
+            midpoint_from = midpoint_to = ()
+        if midpoint != self.midpoint or \
+                (tuple(midpoint_from), tuple(midpoint_to)) != (self.data.midpoint_from, self.data.midpoint_to):
+            self.midpoint = midpoint
+            self.data.find_midpoints(midpoint_from, midpoint_to)
+            layers.update(("aspects", "midpoints"))
+        if "aspects" in layers:
+            self.enabled_aspects = list(enabled_aspects)
+        else:
+            self.set_aspects(enabled_aspects)
+        self.redraw(*layers)
+
+    def move_to(self, data):
+        if data.orbs != self.data.orbs:
+            data.set_orbs(self.data.orbs)
+        if (data.midpoint_from, data.midpoint_to) != (self.data.midpoint_from, self.data.midpoint_to):
+            data.find_midpoints(self.data.midpoint_from, self.data.midpoint_to)
+        self.data = data
+        self.place()
+        layout = self.layout
+        self.backend.move(self.items["houses"], layout.house_lines[ANGULAR_HOUSES + OTHER_HOUSES])
+        self.backend.move(self.items["signs"], layout.sign_lines)
+        self.backend.move(self.items["house_numbers"], layout.house_numbers)
+        self.backend.move(self.items["sign_symbols"], layout.sign_symbols)
+        self.backend.move(self.items["planet_ticks"], layout.planet_ticks)
+        self.backend.move(self.items["glyphs"], layout.glyphs)
+        self.backend.delete("leaders")
+        self.tags = ("planets",)
+        self.draw_leaders()
+        self.redraw("aspects", "tables", "midpoints")
+
+    def oval_object(self, *args, **kwargs):
+        kwargs.setdefault("tags", self.tags)
+        return self.backend.oval_object(*args, **kwargs)
+
+    def line_object(self, *args, **kwargs):
+        kwargs.setdefault("tags", self.tags)
+        return self.backend.line_object(*args, **kwargs)
+
+    def line_objects(self, *args, **kwargs):
+        kwargs.setdefault("tags", self.tags)
+        return self.backend.line_objects(*args, **kwargs)
+
+    def text_object(self, *args, **kwargs):
+        kwargs.setdefault("tags", self.tags)
+        return self.backend.text_object(*args, **kwargs)
+
+    def wheel_angle(self, degree):
+        return (degree - self.data.asc + 180) % 360
+
+    def draw_oval_object(self, x=550, y=350):
+        self.oval_object(x=x, y=y, r=260, dash=False)
+        self.oval_object(x=x, y=y, r=210, dash=False)
+        self.oval_object(x=x, y=y, r=165)
+        self.oval_object(x=x, y=y, r=60, dash=False)
+
+    def draw_line_object(self, x=900, y=1200):
+        self.line_object(x1=x, y1=205, x2=y, y2=205, width=1)
+        self.line_object(x1=x, y1=410, x2=y, y2=410, width=1)
+        self.line_object(x1=x, y1=428, x2=x, y2=624, width=1)
+        self.line_object(x1=x, y1=428 + (13 * 15), x2=x + 25 + (20 * 15), y2=428 + (13 * 15), width=1)
+
+    def draw_houses(self):
+        self.items["houses"] = self.line_objects(self.layout.house_lines[ANGULAR_HOUSES], width=4) + \
+            self.line_objects(self.layout.house_lines[OTHER_HOUSES], width=2)
+
+    def draw_signs(self):
+        self.items["signs"] = self.line_objects(self.layout.sign_lines, width=2)
+
+    def draw_house_numbers(self):
+        self.items["house_numbers"] = [
+            self.text_object(x=x, y=y, _text=f"{i + 1}") for i, (x, y) in enumerate(self.layout.house_numbers.tolist())
+        ]
+
+    def draw_sign_symbols(self):
+        self.items["sign_symbols"] = [
+            self.text_object(x=x, y=y, _text=self._SIGN_SYMBOLS[j], font="Arial 25", fill=self._SIGN_COLORS[j])
+            for j, (x, y) in zip(self.SIGNS, self.layout.sign_symbols.tolist())
+        ]
+
+    def modify_text_object(self, planet_symbol, key):
+        x, y = self.layout.glyphs[self.layout.index[key]].tolist()
+        if key == "Mars" or key == "Venus":
+            if os.name == "posix":
+                return self.text_object(x=x, y=y, _text=f"{planet_symbol}", width=0, font="Arial 30")
+            elif os.name == "nt":
+                return self.text_object(x=x, y=y, _text=f"{planet_symbol}", width=0, font="Arial 20")
+        else:
+            return self.text_object(x=x, y=y, _text=f"{planet_symbol}", width=0, font="Arial 20")
+
+    def draw_planets(self):
+        self.items["planet_ticks"] = self.line_objects(self.layout.planet_ticks, width=2, fill="red")
+        self.draw_leaders()
+        self.items["glyphs"] = [
+            self.modify_text_object(planet_symbol=self.PLANET_SYMBOLS[key], key=key) for key in self.PLANET_DEGREES
+        ]
+
+    def draw_leaders(self):
+        self.line_objects(self.layout.leaders, width=1, fill="gray", tags=self.tags + ("leaders",))
+
+    def parse_positions(self):
+        self.PLANET_INFO_FORMAT = []
+        self.HOUSE_INFO_FORMAT = []
+        for key in self.data.positions:
+            sign, degree, minute, second = engine.sign_dms(self.data.records[key].longitude)
+            self.PLANET_INFO_FORMAT.append((
+                self.PLANET_SYMBOLS[key],
+                key,
+                f"{degree}\u00b0",
+                f"{minute}'",
+                f"{second}\"",
+                self.SIGN_SYMBOLS[sign],
+                self.SIGNS[sign]
+            ))
+        names = {0: "Asc", 3: "IC", 6: "Dsc", 9: "MC"}
+        for i, j in enumerate(self.data.cusps):
+            sign, degree, minute, second = engine.sign_dms(j)
+            self.HOUSE_INFO_FORMAT.append([
+                names.get(i, f"House {i + 1}"),
+                f"{degree}\u00b0",
+                f"{minute}'",
+                f"{second}\"",
+                self.SIGN_SYMBOLS[sign],
+                self.SIGNS[sign]
+            ])
+
+    def draw_aspects(self, enabled_aspects=None):
+        if enabled_aspects is None:
+            enabled_aspects = self.enabled_aspects
+        chords = {}
+        if self.midpoint:
+            for key, aspect, pair in self.data.midpoint_aspects:
+                if aspect in enabled_aspects:
+                    chords.setdefault(aspect, []).append((self.wheel_angle(self.data.midpoints[pair]), key))
+            for aspect, chord in chords.items():
+                angles, targets = zip(*chord)
+                self.line_objects(self.layout.midpoint_chords(angles, targets), width=2, fill=ASPECT_COLORS[aspect],
+                                  tags=self.tags + (f"aspect-{aspect}",))
+        else:
+            for key, aspect, _key in self.data.aspects:
+                if aspect in enabled_aspects:
+                    chords.setdefault(aspect, []).append((key, _key))
+            for aspect, pairs in chords.items():
+                self.line_objects(self.layout.aspect_chords(pairs), width=2, fill=ASPECT_COLORS[aspect],
+                                  tags=self.tags + (f"aspect-{aspect}",))
+
+    def draw_midpoints(self, offset=6):
+        if not self.data.midpoints:
+            return
+        vectors = unit_vectors([self.wheel_angle(i) for i in self.data.midpoints.values()])
+        for i, (x, y) in zip(self.data.midpoints, points(vectors, 282.5).tolist()):
+            self.text_object(x=offset + x, y=offset + y,
+                             _text=f"{self.PLANET_SYMBOLS[i[0]]}/{self.PLANET_SYMBOLS[i[1]]}")
+        self.line_objects(segments(vectors, 260, 270), width=2, fill="red")
+
+    def parse_aspects(self):
+        aspects = {(key, _key): aspect for key, aspect, _key in self.data.aspects}
+        for i, j in enumerate(self.PLANETS):
+            self.ASPECTS[j] = []
+            if j in engine.ANGLES:
+                continue
+            for _j in self.PLANETS[i + 1:]:
+                self.ASPECTS[j].append(self.ASPECT_SYMBOLS[aspects.get((j, _j), "Null")])
+
+    def modify_info(self, k, x, m, i, count1, count2):
+        if k == self._SIGN_SYMBOLS["Aries"] or k == self._SIGN_SYMBOLS["Leo"] or \
+                k == self._SIGN_SYMBOLS["Sagittarius"]:
+            self.text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="red")
+        elif k == self._SIGN_SYMBOLS["Taurus"] or k == self._SIGN_SYMBOLS["Virgo"] or \
+                k == self._SIGN_SYMBOLS["Capricorn"]:
+            self.text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="green")
+        elif k == self._SIGN_SYMBOLS["Gemini"] or k == self._SIGN_SYMBOLS["Libra"] or \
+                k == self._SIGN_SYMBOLS["Aquarius"]:
+            self.text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="yellow")
+        elif k == self._SIGN_SYMBOLS["Cancer"] or k == self._SIGN_SYMBOLS["Scorpio"] or \
+                k == self._SIGN_SYMBOLS["Pisces"]:
+            self.text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="blue")
+        elif k in self.SIGNS or "\u00b0" in k or "'" in k or '"' in k or k in self.PLANETS:
+            pass
+        else:
+            self.text_object(x=x + count1 + (m * 55), y=count2 + (i * 16), font="Arial 10", _text=k, fill="black")
+
+    def draw_planet_info(self, x=900):
+        planet_symbols = ""
+        planets = ""
+        degrees = ""
+        minutes = ""
+        seconds = ""
+        sign_symbols = ""
+        signs = ""
+        for i, j in enumerate(self.PLANET_INFO_FORMAT):
+            planet_symbols += f"{j[0]}\n"
+            planets += f"{j[1]}\n"
+            degrees += f"{j[2]}\n"
+            minutes += f"{j[3]}\n"
+            seconds += f"{j[4]}\n"
+            sign_symbols += f"{j[5]}\n"
+            signs += f"{j[6]}\n"
+            for m, k in enumerate(j):
+                if k == self.PLANET_SYMBOLS["Mars"] or k == self.PLANET_SYMBOLS["Venus"]:
+                    if os.name == "posix":
+                        self.text_object(x=x + 10 + (m * 60), y=15 + (i * 15), font="Arial 15", _text=k)
+                    elif os.name == "nt":
+                        self.text_object(x=x + 10 + (m * 60), y=15 + (i * 15), font="Arial 9", _text=k)
+                else:
+                    self.modify_info(k=k, x=x, m=m, i=i, count1=10, count2=15)
+        self.text_object(x=x + 240, y=110, font="Arial 10", _text=signs)
+        self.text_object(x=x + 60, y=110, font="Arial 10", _text=planets)
+        self.text_object(x=x + 180, y=110, font="Arial 10", _text=seconds)
+        self.text_object(x=x + 150, y=110, font="Arial 10", _text=minutes)
+        self.text_object(x=x + 120, y=110, font="Arial 10", _text=degrees)
+
+    def draw_house_info(self, x=900):
+        houses = ""
+        degrees = ""
+        minutes = ""
+        seconds = ""
+        sign_symbols = ""
+        signs = ""
+        for i, j in enumerate(self.HOUSE_INFO_FORMAT):
+            houses += f"{j[0]}\n"
+            degrees += f"{j[1]}\n"
+            minutes += f"{j[2]}\n"
+            seconds += f"{j[3]}\n"
+            sign_symbols += f"{j[4]}\n"
+            signs += f"{j[5]}\n"
+            for m, k in enumerate(j):
+                if k == j[0]:
+                    pass
+                else:
+                    self.modify_info(k=k, x=x, m=m, i=i, count1=65, count2=220)
+        self.text_object(x=x + 30, y=315, font="Arial 10", _text=houses)
+        self.text_object(x=x + 120, y=315, font="Arial 10", _text=degrees)
+        self.text_object(x=x + 150, y=315, font="Arial 10", _text=minutes)
+        self.text_object(x=x + 180, y=315, font="Arial 10", _text=seconds)
+        self.text_object(x=x + 240, y=315, font="Arial 10", _text=signs)
+
+    def draw_aspect_info(self, x=900):
+        i = np.arange(len(self.ASPECTS) - 1)
+        column = x + 25 + i * 25
+        row = 428 + i * 15
+        self.line_objects(np.column_stack([column, row, column, np.full(len(i), 624)]), width=1)
+        self.line_objects(np.column_stack([np.full(len(i), x), row, column, row]), width=1)
+        for i, j in enumerate(self.ASPECTS.items()):
+            if j[0] == "Mars" or j[0] == "Venus":
+                if os.name == "posix":
+                    self.text_object(x=x + 15 + (i * 25), y=420 + (i * 15), _text=self.PLANET_SYMBOLS[j[0]],
+                                     font="Arial 15")
+                elif os.name == "nt":
+                    self.text_object(x=x + 15 + (i * 25), y=420 + (i * 15), _text=self.PLANET_SYMBOLS[j[0]],
+                                     font="Arial 10")
+            else:
+                self.text_object(x=x + 15 + (i * 25), y=420 + (i * 15), _text=self.PLANET_SYMBOLS[j[0]],
+                                 font="Arial 10")
+            for k, m in enumerate(j[1]):
+                if m == self.ASPECT_SYMBOLS["Sextile"] or m == self.ASPECT_SYMBOLS["Trine"]:
+                    self.text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m,
+                                     font="Arial 10", fill="blue")
+                elif m == self.ASPECT_SYMBOLS["Conjunction"] or m == self.ASPECT_SYMBOLS["Square"] or \
+                        m == self.ASPECT_SYMBOLS["Opposite"]:
+                    self.text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m,
+                                     font="Arial 10", fill="red")
+                elif m == self.ASPECT_SYMBOLS["Semi-Sextile"] or m == self.ASPECT_SYMBOLS["Quincunx"]:
+                    self.text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m,
+                                     font="Arial 10", fill="green")
+                else:
+                    self.text_object(x=x + 15 + (i * 25), y=420 + (i * 15) + ((k + 1) * 15), _text=m,
+                                     font="Arial 10")
+
+    def chart_info_data(self, calender="Julian"):
+        return "\n".join(
+            [
+                f"{self.data.day}.{self.data.month}.{self.data.year} ({calender})",
+                f"{self.data.hour}:{self.data.minute}",
+                f"{self.data.latitude}",
+                f"{self.data.longitude}"
+            ]
+        )
+
+    def draw_chart_info(self):
+        chart_info_titles = "\n".join(
+            [
+                "Date:",
+                "Time:",
+                "Latitude:",
+                "Longitude:",
+            ]
+        )
+        chart_info_datas = "\n".join(
+            [
+                f"{self.data.day}.{self.data.month}.{self.data.year}",
+                f"{self.data.hour}:{self.data.minute}",
+                f"{self.data.latitude}",
+                f"{self.data.longitude}"
+            ]
+        )
+        self.text_object(x=75, y=60, _text=chart_info_titles, font="Arial 10", fill="red")
+        self.text_object(x=175, y=60, _text=chart_info_datas, font="Arial 10")
+
+
+def svg(data, enabled_aspects=(), midpoint=False):
+    return Wheel(data, enabled_aspects=enabled_aspects, midpoint=midpoint, backend=SvgBackend()).draw().document()
+
+
+def png(data, path=None, enabled_aspects=(), midpoint=False):
+    return Wheel(data, enabled_aspects=enabled_aspects, midpoint=midpoint, backend=SvgBackend()).draw().png(path)
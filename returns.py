@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+import math
+
+import swisseph as swe
+import engine
+import timezones
+from transits import MAX_STEP, MAX_STEPS, STEP_DEGREES, TOLERANCE, find_station, position, refine, wrap
+
+# Largest geocentric speed of each body in degrees per day, forward and backward, measured
+# over 1800-2200 with a margin for the centuries around it.
+SPEED_LIMITS = {
+    swe.SUN: (1.1, 0.0),
+    swe.MOON: (16.5, 0.0),
+    swe.MERCURY: (2.4, 1.5),
+    swe.VENUS: (1.4, 0.7),
+    swe.MARS: (0.9, 0.45),
+    swe.JUPITER: (0.27, 0.15),
+    swe.SATURN: (0.15, 0.09),
+    swe.URANUS: (0.072, 0.05),
+    swe.NEPTUNE: (0.048, 0.032),
+    swe.PLUTO: (0.05, 0.035),
+    swe.TRUE_NODE: (0.4, 0.5),
+    swe.CHIRON: (0.2, 0.12)
+}
+
+# Returns closer than this to the start (about 9 seconds) belong to the start itself.
+MIN_INTERVAL = 1e-4
+
+
+def safe_skip(planet, gap):
+    forward, backward = SPEED_LIMITS.get(planet, (math.inf, math.inf))
+    if backward:
+        return min(gap / forward, (360 - gap) / backward)
+    return gap / forward
+
+
+def find_return(planet, longitude, jd_start, jd_end=None, tolerance=TOLERANCE):
+    longitude %= 360
+    t0 = jd_start
+    lon0, v0 = position(t0, planet)
+    while jd_end is None or t0 < jd_end:
+        step = min(MAX_STEPS.get(planet, MAX_STEP), STEP_DEGREES / max(abs(v0), 1e-6))
+        # The body cannot reach the longitude sooner than at its top speed, in either direction.
+        skip = safe_skip(planet, (longitude - lon0) % 360)
+        if skip > step:
+            t0 += skip
+            lon0, v0 = position(t0, planet)
+            continue
+        t1 = t0 + step
+        lon1, v1 = position(t1, planet)
+        if (v0 > 0) != (v1 > 0):
+            ts = find_station(planet, t0, v0, t1)
+            lons = position(ts, planet)[0]
+            pieces = (t0, lon0, ts, lons), (ts, lons, t1, lon1)
+        else:
+            pieces = (t0, lon0, t1, lon1),
+        for a, lon_a, b, lon_b in pieces:
+            ga = wrap(lon_a - longitude)
+            gb = wrap(lon_b - longitude)
+            if (ga > 0) != (gb > 0) and abs(gb - ga) < 180:
+                jd = refine(planet, longitude, a, ga, b, gb, tolerance)
+                if jd - jd_start > MIN_INTERVAL:
+                    return jd if jd_end is None or jd <= jd_end else None
+        t0, lon0, v0 = t1, lon1, v1
+    return None
+
+
+def iter_returns(planet, longitude, jd_start, jd_end=None, count=None, tolerance=TOLERANCE):
+    found = 0
+    jd = jd_start
+    while count is None or found < count:
+        jd = find_return(planet, longitude, jd, jd_end, tolerance)
+        if jd is None:
+            return
+        yield jd
+        found += 1
+
+
+def returns(chart, body, jd_start=None, jd_end=None, count=None, tolerance=TOLERANCE):
+    if body not in engine.PLANETS:
+        raise ValueError(f"Unknown body: {body}")
+    if jd_end is None and count is None:
+        raise ValueError("Either jd_end or count is required")
+    engine.ensure_ephe_path()
+    return list(iter_returns(engine.PLANETS[body], chart.degrees[body], chart.jd if jd_start is None else jd_start,
+                             jd_end, count, tolerance))
+
+
+def solar_returns(chart, count, jd_start=None):
+    return returns(chart, "Sun", jd_start, count=count)
+
+
+def lunar_returns(chart, count, jd_start=None):
+    return returns(chart, "Moon", jd_start, count=count)
+
+
+def return_chart(chart, jd, latitude=None, longitude=None, zone=None):
+    if latitude is None or longitude is None:
+        latitude, longitude, zone = chart.latitude, chart.longitude, zone or chart.zone
+    elif zone is None:
+        zone = timezones.zone_at(latitude, longitude)
+    ut = round((jd - engine.cached_deltat(jd) + 0.5) * 1440)
+    year, month, day = engine.calendar_date(ut // 1440, "Gregorian")
+    offset = timezones.universal_offset(zone, year, month, day, *divmod(ut % 1440, 60), longitude)
+    number, minutes = divmod(ut + round(offset * 60), 1440)
+    year, month, day = engine.calendar_date(number, chart.calendar)
+    base = engine.ChartData(year, month, day, *divmod(minutes, 60), longitude, latitude, orbs=chart.orbs,
+                            profile=chart.base_profile, midpoint_from=chart.midpoint_from,
+                            midpoint_to=chart.midpoint_to, house_system=chart.house_system,
+                            calendar=chart.calendar, zone=zone)
+    # The wall clock keeps whole minutes; the shift puts the chart on the exact moment.
+    return base.shifted(jd - base.jd)
+
+
+def return_charts(chart, body, jd_start=None, jd_end=None, count=None, latitude=None, longitude=None, zone=None):
+    return [return_chart(chart, jd, latitude, longitude, zone)
+            for jd in returns(chart, body, jd_start, jd_end, count)]
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import swisseph as swe
+import engine
+import render
+from cli import FLOAT_FIELDS, INTEGER_FIELDS, parse_flag
+
+MAX_BODY = 1 << 20
+
+KEEP_ALIVE = 15
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented"
+}
+
+
+def names(value):
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [i.strip() for i in value.split(",") if i.strip()]
+    return [str(i) for i in value]
+
+
+def orbs(value):
+    if not value:
+        return {}
+    if isinstance(value, str):
+        pairs = [i.split(":") for i in names(value)]
+        for pair in pairs:
+            if len(pair) != 2:
+                raise ValueError(f"orbs entry must be 'name:orb': {':'.join(pair)}")
+        value = dict(pairs)
+    if not isinstance(value, dict):
+        raise ValueError("orbs must be an object or 'name:orb,...' string")
+    return {str(key): float(orb) for key, orb in value.items()}
+
+
+def parse_params(values):
+    params = {i: int(values[i]) for i in INTEGER_FIELDS}
+    params.update({i: float(values[i]) for i in FLOAT_FIELDS})
+    params["dst"] = parse_flag(values.get("dst") or False)
+    params["zone"] = values.get("zone") or None
+    params["calendar"] = values.get("calendar") or None
+    params["house_system"] = values.get("house_system") or "P"
+    if not isinstance(params["house_system"], str) or len(params["house_system"]) != 1:
+        raise ValueError("house_system takes one letter")
+    params["orbs"] = orbs(values.get("orbs"))
+    params["aspects"] = names(values.get("aspects"))
+    params["midpoint_from"] = names(values.get("midpoint_from"))
+    params["midpoint_to"] = names(values.get("midpoint_to"))
+    params["midpoint"] = parse_flag(values.get("midpoint") or False)
+    params["format"] = values.get("format") or "svg"
+    if params["format"] not in ("svg", "png"):
+        raise ValueError(f"Unknown format: {params['format']}")
+    return params
+
+
+def chart_data(params):
+    return engine.ChartData(
+        year=params["year"],
+        month=params["month"],
+        day=params["day"],
+        hour=params["hour"],
+        minute=params["minute"],
+        longitude=params["longitude"],
+        latitude=params["latitude"],
+        dst=params["dst"],
+        orbs=params["orbs"],
+        midpoint_from=params["midpoint_from"],
+        midpoint_to=params["midpoint_to"],
+        house_system=params["house_system"],
+        calendar=params["calendar"],
+        zone=params["zone"]
+    )
+
+
+def json_body(value):
+    return "application/json", json.dumps(value).encode("utf-8")
+
+
+def aspect_rows(data, enabled=()):
+    table = data.aspect_table
+    bodies = list(data.degrees.keys())
+    applying = table.applying.tolist() if table.applying is not None else [None] * len(table)
+    rows = []
+    for a, aspect, b, orb, moving in zip(table.body_a.tolist(), table.aspect.tolist(), table.body_b.tolist(),
+                                         table.orb.tolist(), applying):
+        name = table.names[aspect]
+        if not enabled or name in enabled:
+            rows.append({"body_a": bodies[a], "aspect": name, "body_b": bodies[b], "orb": orb, "applying": moving})
+    return rows
+
+
+def chart_endpoint(params):
+    data = chart_data(params)
+    return json_body({
+        "jd": data.jd,
+        "zone": data.zone,
+        "utc_offset": data.utc_offset,
+        "positions": {
+            key: {"longitude": value.longitude, "latitude": value.latitude, "distance": value.distance,
+                  "speed": value.speed, "sign": value.sign, "house": value.house}
+            for key, value in data.records.items() if key in data.positions
+        },
+        "asc": data.asc,
+        "mc": data.mc,
+        "cusps": data.cusps,
+        "aspects": aspect_rows(data, params["aspects"])
+    })
+
+
+def aspects_endpoint(params):
+    data = chart_data(params)
+    return json_body({
+        "aspects": aspect_rows(data, params["aspects"]),
+        "midpoints": [list(i) for i in data.midpoint_aspects]
+    })
+
+
+def render_endpoint(params):
+    data = chart_data(params)
+    if params["format"] == "png":
+        return "image/png", render.png(data, enabled_aspects=params["aspects"], midpoint=params["midpoint"])
+    return "image/svg+xml", render.svg(data, enabled_aspects=params["aspects"],
+                                       midpoint=params["midpoint"]).encode("utf-8")
+
+
+ENDPOINTS = {
+    "/chart": chart_endpoint,
+    "/aspects": aspects_endpoint,
+    "/render": render_endpoint
+}
+
+
+class ChartServer:
+    def __init__(self, workers=None, cache_size=1024, ephe_path=None):
+        self.workers = workers
+        self.cache_size = cache_size
+        self.ephe_path = ephe_path or engine.default_ephe_path()
+        self.cache = OrderedDict()
+        self.pending = {}
+        self.stats = {"requests": 0, "computed": 0, "coalesced": 0, "cached": 0}
+        self.executor = None
+        self.server = None
+
+    async def start(self, host="127.0.0.1", port=8000):
+        if self.executor is None:
+            # Forked workers would inherit the sockets of open connections and keep them from closing.
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=engine.set_ephe_path, initargs=(self.ephe_path,))
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+    def store(self, key, future):
+        self.pending.pop(key, None)
+        if future.cancelled() or future.exception() is not None or self.cache_size == 0:
+            return
+        self.cache[key] = future.result()
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    async def compute(self, path, params):
+        key = path, json.dumps(params, sort_keys=True)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.stats["cached"] += 1
+            return self.cache[key]
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, ENDPOINTS[path], params)
+            future.add_done_callback(lambda done: self.store(key, done))
+            self.pending[key] = future
+            self.stats["computed"] += 1
+        else:
+            self.stats["coalesced"] += 1
+        # A client that goes away must not cancel the work other clients wait for.
+        return await asyncio.shield(future)
+
+    async def respond(self, method, target, body):
+        url = urlsplit(target)
+        if url.path == "/stats":
+            return (200,) + json_body(dict(self.stats, pending=len(self.pending), cache=len(self.cache)))
+        if url.path not in ENDPOINTS:
+            return (404,) + json_body({"error": f"Unknown endpoint: {url.path}"})
+        try:
+            if method == "GET":
+                values = dict(parse_qsl(url.query))
+            elif method == "POST":
+                values = json.loads(body or b"{}")
+                if not isinstance(values, dict):
+                    raise ValueError("The request body must be a JSON object")
+            else:
+                return (405,) + json_body({"error": f"Method not allowed: {method}"})
+            params = parse_params(values)
+        except KeyError as error:
+            return (400,) + json_body({"error": f"Missing field: {error.args[0]}"})
+        except (TypeError, ValueError) as error:
+            return (400,) + json_body({"error": str(error)})
+        try:
+            return (200,) + await self.compute(url.path, params)
+        except (ValueError, swe.Error) as error:
+            return (400,) + json_body({"error": str(error)})
+        except ImportError as error:
+            return (501,) + json_body({"error": str(error)})
+        except Exception as error:
+            return (500,) + json_body({"error": repr(error)})
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(read_request(reader), KEEP_ALIVE)
+                except asyncio.TimeoutError:
+                    break
+                if request is None:
+                    break
+                if isinstance(request, int):
+                    await write_response(writer, request, *json_body({"error": REASONS[request]}), close=True)
+                    break
+                method, target, version, headers, body = request
+                self.stats["requests"] += 1
+                status, content_type, payload = await self.respond(method, target, body)
+                connection = headers.get("connection", "").lower()
+                close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+                await write_response(writer, status, content_type, payload, close=close)
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def read_request(reader):
+    line = await reader.readline()
+    if not line.strip():
+        return None
+    try:
+        method, target, version = line.decode("latin-1").split()
+    except ValueError:
+        return 400
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        return 400
+    if length > MAX_BODY:
+        return 413
+    body = await reader.readexactly(length) if length else b""
+    return method, target, version, headers, body
+
+
+async def write_response(writer, status, content_type, payload, close=False):
+    head = [
+        f"HTTP/1.1 {status} {REASONS[status]}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(payload)}",
+        f"Connection: {'close' if close else 'keep-alive'}"
+    ]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+    await writer.drain()
+
+
+async def serve(host, port, **kwargs):
+    server = ChartServer(**kwargs)
+    await server.start(host, port)
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve charts, aspects and chart wheels over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--cache-size", type=int, default=1024, help="cached responses (default: 1024)")
+    parser.add_argument("--ephe-path", help="Swiss Ephemeris folder (default: Eph next to engine.py)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers, cache_size=args.cache_size,
+                          ephe_path=args.ephe_path))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from aspects import find_aspects
+
+
+def test_find_aspects():
+    table = find_aspects([0.0, 90.5, 181.0, 240.0])
+    rows = {(a, table.names[k], b) for a, k, b in zip(table.body_a, table.aspect, table.body_b)}
+    assert (0, "Square", 1) in rows
+    assert (0, "Opposite", 2) in rows
+    assert (0, "Trine", 3) in rows
+    assert np.all(table.orb >= 0)
+
+
+def test_batch_matches_single():
+    degrees = np.random.default_rng(0).uniform(0, 360, (50, 14))
+    table = find_aspects(degrees)
+    for i in range(len(degrees)):
+        single = find_aspects(degrees[i])
+        mine = table.chart == i
+        assert np.array_equal(single.body_a, table.body_a[mine])
+        assert np.array_equal(single.aspect, table.aspect[mine])
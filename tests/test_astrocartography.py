@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import astrocartography
+import engine
+
+JD = 2448029.1
+LATITUDES = np.arange(-80.0, 81.0, 10.0)
+LONGITUDES = np.arange(-180.0, 180.0, 15.0)
+
+
+def difference(a, b):
+    return np.abs((a - b + 180) % 360 - 180)
+
+
+def test_fast_matches_exact():
+    fast = astrocartography.angles_grid(JD, LATITUDES, LONGITUDES)
+    exact = astrocartography.angles_grid(JD, LATITUDES, LONGITUDES, exact=True, workers=2,
+                                         ephe_path=engine.default_ephe_path())
+    shape = (len(LATITUDES), len(LONGITUDES))
+    for name in ("asc", "mc", "dsc", "ic"):
+        assert fast[name].shape == exact[name].shape == shape
+    assert exact["cusps"].shape == shape + (12,)
+    assert "cusps" not in fast
+    assert difference(fast["mc"], exact["mc"]).max() < 1e-6
+    outside = np.abs(LATITUDES) < 66
+    assert difference(fast["asc"], exact["asc"])[outside].max() < 1e-6
+    # Placidus has no cusps inside the polar circles.
+    assert not np.isnan(exact["cusps"][outside]).any()
+    assert np.isnan(exact["cusps"][~outside]).all()
+
+
+def test_workers_match_serial():
+    serial = astrocartography.angles_grid(JD, LATITUDES, LONGITUDES, exact=True, workers=1)
+    pooled = astrocartography.angles_grid(JD, LATITUDES, LONGITUDES, exact=True, workers=2)
+    for name in ("asc", "mc", "cusps"):
+        np.testing.assert_array_equal(serial[name], pooled[name])
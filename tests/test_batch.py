@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+import batch
+import engine
+
+RECORDS = [
+    (1990, 5, 17, 14, 30, 41.0, 29.0),
+    (1582, 10, 10, 12, 0, 41.9, 12.5),
+    (1990, 5, 17, 14, 30, 70.0, 28.97),
+    (2001, 9, 11, 8, 46, 40.7, -74.0)
+]
+
+
+def test_matches_chart_data():
+    result = batch.compute_batch(RECORDS)
+    for i, (year, month, day, hour, minute, latitude, longitude) in enumerate(RECORDS):
+        if np.isnan(result.jd[i]):
+            continue
+        chart = engine.ChartData(year, month, day, hour, minute, longitude, latitude)
+        assert result.jd[i] == chart.jd
+        assert result.positions[i, :, 0].tolist() == [chart.degrees[name] for name in result.planets]
+        assert result.cusps[i].tolist() == pytest.approx(chart.cusps)
+
+
+def test_failed_rows_stay_nan():
+    result = batch.compute_batch(RECORDS)
+    assert np.isnan(result.jd[[1, 2]]).all()
+    assert np.isnan(result.positions[[1, 2]]).all()
+    assert not np.isnan(result.jd[[0, 3]]).any()
+    assert set(result.aspects.chart.tolist()) <= {0, 3}
+
+
+def test_aspects_for():
+    result = batch.compute_batch(RECORDS)
+    chart = engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0)
+    table = result.aspects
+    rows = [(result.bodies[a], table.names[k], result.bodies[b])
+            for c, a, k, b in zip(table.chart, table.body_a, table.aspect, table.body_b) if c == 0]
+    assert sorted(rows) == sorted(chart.aspects)
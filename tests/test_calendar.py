@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+import pytest
+import swisseph as swe
+import engine
+
+
+def test_calendar_round_trip():
+    random.seed(0)
+    for _ in range(2000):
+        number = random.randint(0, 3000000)
+        for calendar in engine.CALENDARS:
+            year, month, day = engine.calendar_date(number, calendar)
+            assert engine.day_number(year, month, day, calendar) == number
+
+
+def test_calendar_matches_swe():
+    for year, month, day in ((1500, 3, 1), (1582, 10, 4), (1582, 10, 15), (1990, 5, 17), (-500, 2, 28)):
+        calendar = "Julian" if (year, month, day) < (1582, 10, 15) else "Gregorian"
+        flag = swe.JUL_CAL if calendar == "Julian" else swe.GREG_CAL
+        assert engine.day_number(year, month, day) == int(swe.julday(year, month, day, 12, flag))
+
+
+@pytest.mark.parametrize("date, calendar", [
+    ((1582, 10, 10), None),
+    ((1990, 2, 30), None),
+    ((1900, 2, 29), "Gregorian"),
+    ((1990, 13, 1), "Julian")
+])
+def test_invalid_dates(date, calendar):
+    with pytest.raises(ValueError):
+        engine.day_number(*date, calendar)
+
+
+def test_unknown_calendar():
+    with pytest.raises(ValueError):
+        engine.day_number(1990, 1, 1, "Hebrew")
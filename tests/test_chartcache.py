@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import chartcache
+import engine
+
+
+def test_cached_chart(tmp_path):
+    with chartcache.ChartCache(str(tmp_path / "charts.sqlite")) as cache:
+        first = engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0, cache=cache)
+        second = engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0, cache=cache)
+        assert second.degrees == first.degrees
+        assert second.aspects == first.aspects
+        assert second.swe_calls < first.swe_calls
+        assert cache.stats["hits"] == 1
+
+
+def test_eviction_keeps_recent_hits(tmp_path):
+    path = str(tmp_path / "charts.sqlite")
+    cache = chartcache.ChartCache(path, max_entries=3)
+    for key in "abc":
+        cache.put(key, {"key": key})
+    cache.get("a")
+    cache.put("d", {"key": "d"})
+    assert cache.get("b") is None
+    assert cache.get("a") == {"key": "a"}
+    cache.close()
+    cache = chartcache.ChartCache(path, max_entries=3)
+    assert len(cache) == 3
+    cache.put("e", {"key": "e"})
+    assert cache.get("a") == {"key": "a"}
+    assert cache.get("c") is None
+    cache.close()
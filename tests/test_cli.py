@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+import csv
+import io
+import json
+
+import cli
+
+ROW = {"id": "a", "year": 1990, "month": 5, "day": 17, "hour": 14, "minute": 30, "latitude": 41, "longitude": 29}
+
+
+def run(tmp_path, text, suffix, *args):
+    source = tmp_path / f"in{suffix}"
+    source.write_text(text, encoding="utf-8")
+    target = tmp_path / "out.jsonl"
+    assert cli.main([str(source), "-o", str(target), "--bodies", "Sun,Moon"] + list(args)) == 0
+    return [json.loads(i) for i in target.read_text(encoding="utf-8").splitlines()]
+
+
+def test_jsonl(tmp_path, capsys):
+    lines = [json.dumps(ROW), '{"year": 1990,', "[1, 2]", json.dumps(dict(ROW, id="b", day=30, month=2))]
+    rows = run(tmp_path, "\n".join(lines) + "\n", ".jsonl")
+    assert len(rows) == 4
+    assert rows[0]["id"] == "a" and set(rows[0]["positions"]) == {"Sun", "Moon"}
+    assert rows[1] == {"input": '{"year": 1990,', "error": "invalid record"}
+    assert rows[2]["error"] == "invalid record"
+    assert rows[3]["id"] == "b" and rows[3]["error"] == "invalid record"
+    assert capsys.readouterr().err.count("record") == 3
+
+
+def test_csv_order(tmp_path):
+    output = io.StringIO()
+    writer = csv.DictWriter(output, list(ROW))
+    writer.writeheader()
+    for i in range(25):
+        writer.writerow(dict(ROW, id=str(i), year=1950 + i))
+    rows = run(tmp_path, output.getvalue(), ".csv", "--chunk-size", "7")
+    assert [i["id"] for i in rows] == [str(i) for i in range(25)]
+    assert all("jd" in i for i in rows)
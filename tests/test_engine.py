@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import swisseph as swe
+import engine
+
+
+@pytest.mark.parametrize("angle, expected", [
+    (0, (0, 0, 0, 0)),
+    (29.99999, (1, 0, 0, 0)),
+    (359.999999, (0, 0, 0, 0)),
+    (46 + 46 / 60 + 59.9999 / 3600, (1, 16, 47, 0)),
+    (-30, (11, 0, 0, 0))
+])
+def test_sign_dms(angle, expected):
+    assert engine.sign_dms(angle) == expected
+
+
+def test_records():
+    chart = engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0)
+    assert chart.zone == "Europe/Istanbul"
+    assert chart.utc_offset == 3.0
+    assert set(chart.records) == set(engine.PLANETS) | set(engine.ANGLES)
+    armc = swe.houses(chart.jd, chart.latitude, chart.longitude, b"P")[1][2]
+    obliquity = swe.calc_ut(chart.jd, swe.ECL_NUT)[0][0]
+    for name, record in chart.records.items():
+        assert record.longitude == chart.degrees[name]
+        assert record.sign == int(record.longitude // 30)
+        expected = swe.house_pos(armc, chart.latitude, obliquity, (record.longitude, 0.0), b"P")
+        assert record.house == int(expected + 1e-9) - 1
+
+
+def test_sign_boundary_chart():
+    chart = engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0)
+    chart.cusps = [30.0 * i for i in range(12)]
+    record = engine.Position(60.0, cusps=chart.cusps)
+    assert (record.sign, record.house) == (2, 2)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+import swisseph as swe
+import engine
+import ephtable
+
+# Longitude error bounds given in the README.
+BOUNDS = {
+    "Sun": 1e-6,
+    "Moon": 1e-6,
+    "North Node": 5e-5
+}
+
+OTHER_BOUND = 2e-3
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("table")
+    # Mercury and every planet from Jupiter out pass a conjunction with the Sun in this range.
+    return ephtable.build(str(path), swe.julday(2019, 12, 1, 0), swe.julday(2020, 6, 1, 0))
+
+
+@pytest.mark.parametrize("name", list(engine.PLANETS))
+def test_max_error(table, name):
+    error = table.max_error(engine.PLANETS[name], samples=2000)
+    assert error["longitude"] < BOUNDS.get(name, OTHER_BOUND)
+
+
+def test_lookup_matches_calc_ut(table):
+    jd = np.linspace(table.jd_start, table.jd_end, 50)
+    longitude, latitude, speed = table.lookup(jd, swe.MARS)
+    exact = np.array([engine.calc_ut(i, swe.MARS)[:4] for i in jd])
+    assert np.allclose(latitude, exact[:, 1], atol=1e-3)
+    assert np.allclose(speed, exact[:, 3], atol=1e-3)
+
+
+def test_lookup_outside_range(table):
+    with pytest.raises(ValueError):
+        table.lookup(table.jd_end + 1, swe.SUN)
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import batch
+import export
+
+RECORDS = [(1950 + i, 1 + i % 12, 1 + i % 28, i % 24, i % 60, 41.0 - i % 30, 29.0 + i) for i in range(30)]
+
+
+def test_npz_round_trip(tmp_path):
+    result = batch.compute_batch(RECORDS)
+    path = str(tmp_path / "charts.npz")
+    export.save_npz(path, result)
+    loaded = export.load_npz(path)
+    assert np.array_equal(loaded.jd, result.jd)
+    assert np.array_equal(loaded.positions, result.positions)
+    assert np.array_equal(loaded.aspects.chart, result.aspects.chart)
+    assert loaded.aspects.names == result.aspects.names
+
+
+def test_npz_unordered_chunks(tmp_path):
+    whole = batch.compute_batch(RECORDS)
+    parts = [(offset, batch.compute_batch(RECORDS[offset:offset + 10])) for offset in (20, 0, 10)]
+    path = str(tmp_path / "charts.npz")
+    export.save_npz(path, parts)
+    loaded = export.load_npz(path)
+    assert np.array_equal(loaded.jd, whole.jd)
+    assert np.array_equal(loaded.aspects.chart, whole.aspects.chart)
+    assert np.array_equal(loaded.aspects.orb, whole.aspects.orb)
+
+
+def test_chart_columns():
+    result = batch.compute_batch(RECORDS[:5])
+    columns = export.chart_columns(result, offset=100)
+    assert columns["chart"].tolist() == list(range(100, 105))
+    assert np.array_equal(columns["Sun longitude"], result.positions[:, 0, 0])
+    assert np.array_equal(columns["House 12"], result.cusps[:, 11])
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+import numpy as np
+import pytest
+from aspects import DEFAULT_PROFILE
+from midpoints import DIALS, MidpointIndex, distance, midpoints
+
+
+def random_degrees(n):
+    return {f"Body {i}": random.uniform(0, 360) for i in range(n)}
+
+
+def test_midpoints_take_the_short_arc():
+    degrees = np.array([350.0, 10.0, 100.0])
+    assert midpoints(degrees, np.array([0, 0]), np.array([1, 2])) == pytest.approx([0.0, 45.0])
+
+
+@pytest.mark.parametrize("dial", DIALS)
+def test_window_matches_brute_force(dial):
+    random.seed(dial)
+    for _ in range(50):
+        index = MidpointIndex(random_degrees(random.randint(2, 20)), dial=dial)
+        assert np.all(np.diff(index.folded) >= 0)
+        for _ in range(20):
+            center = random.uniform(0, dial)
+            orb = random.choice([0.5, 2.0, 10.0, dial / 2])
+            found = set(index.window(center, orb).tolist())
+            close = {i for i in range(len(index)) if distance(center, index.folded[i], dial) < orb}
+            assert close <= found
+            within, orbs = index.within(center, orb)
+            assert set(within.tolist()) == close
+            assert np.all(np.diff(orbs) >= 0)
+
+
+def test_tree_matches_brute_force():
+    random.seed(1)
+    for _ in range(50):
+        degrees = random_degrees(12)
+        index = MidpointIndex(degrees)
+        bodies = list(degrees)
+        for body in bodies:
+            tree = {pair for pair, _, _ in index.tree(body, 1.5)}
+            expected = set()
+            for i, a in enumerate(bodies):
+                for b in bodies[i + 1:]:
+                    if body in (a, b):
+                        continue
+                    mid = midpoints(np.array([degrees[a], degrees[b]]), 0, 1)
+                    if distance(degrees[body], mid) < 1.5:
+                        expected.add((a, b))
+            assert tree == expected
+
+
+def test_aspects_match_brute_force():
+    random.seed(2)
+    for _ in range(30):
+        degrees = random_degrees(12)
+        index = MidpointIndex(degrees)
+        targets = list(degrees)[:4]
+        expected = []
+        for target in targets:
+            factor = DEFAULT_PROFILE.factors([target])[0]
+            for i in range(len(index)):
+                separation = distance(degrees[target], index.midpoints[i])
+                for name, angle, orb in zip(DEFAULT_PROFILE.names, DEFAULT_PROFILE.angles,
+                                            DEFAULT_PROFILE.orbs * factor):
+                    if abs(separation - angle) < orb and (angle > 0 or separation > 0):
+                        expected.append((target, name, index.pair(i)))
+                        break
+        assert sorted(index.aspects(targets)) == sorted(expected)
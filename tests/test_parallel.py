@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import random
+
+import numpy as np
+import pytest
+import batch
+import parallel
+
+
+def make_records(n):
+    random.seed(4)
+    records = [(random.randint(1900, 2050), random.randint(1, 12), random.randint(1, 28), random.randint(0, 23),
+                random.randint(0, 59), random.uniform(-60, 60), random.uniform(-180, 180)) for _ in range(n)]
+    # Rows without a chart: an invalid date and a latitude without Placidus cusps.
+    records[3] = (1990, 2, 30, 12, 0, 41.0, 29.0)
+    records[10] = (1990, 5, 17, 14, 30, 70.0, 28.97)
+    return records
+
+
+def aspect_rows(result, offset=0):
+    table = result.aspects
+    return [(int(c) + offset, int(a), int(b), int(k)) for c, a, b, k in
+            zip(table.chart, table.body_a, table.body_b, table.aspect)]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_matches_compute_batch(ordered):
+    records = make_records(30)
+    expected = batch.compute_batch(records)
+    parts = list(parallel.compute_parallel(records, workers=2, chunk_size=4, ordered=ordered))
+    offsets = [offset for offset, _ in parts]
+    if ordered:
+        assert offsets == sorted(offsets)
+    assert sorted(offsets) == list(range(0, len(records), 4))
+    rows = []
+    for offset, result in parts:
+        part = slice(offset, offset + len(result))
+        for name in ("jd", "positions", "cusps", "asc", "mc"):
+            np.testing.assert_array_equal(getattr(result, name), getattr(expected, name)[part])
+        rows.extend(aspect_rows(result, offset))
+    assert sorted(rows) == sorted(aspect_rows(expected))
+    assert np.isnan(expected.jd[[3, 10]]).all()
+
+
+def test_runner_stats():
+    records = make_records(30)
+    with parallel.BatchRunner(workers=2, chunk_size=8) as runner:
+        total = sum(len(result) for _, result in runner.run(records))
+    assert total == runner.charts == 30
+    assert sum(stats.charts for stats in runner.stats.values()) == 30
+    assert sum(stats.chunks for stats in runner.stats.values()) == 4
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from aspects import DEFAULT_PROFILE, AspectProfile
+
+
+def test_harmonic_angle():
+    profile = AspectProfile([{"name": "Bi-Septile", "harmonic": 7, "multiple": 2, "orb": 1}])
+    assert profile.angles[0] == pytest.approx(720 / 7)
+
+
+@pytest.mark.parametrize("aspect", [
+    {"name": "X", "harmonic": 0, "orb": 1},
+    {"name": "X", "harmonic": "7", "orb": 1},
+    {"name": "X", "harmonic": None, "orb": 1},
+    {"name": "X", "angle": "60", "orb": 1},
+    {"name": "X", "angle": None, "orb": 1},
+    {"name": "X", "angle": 60, "orb": "1"},
+    {"name": "X", "angle": 200, "orb": 1},
+    {"name": "X", "angle": 60},
+    {"angle": 60, "orb": 1},
+    "Sextile"
+])
+def test_invalid_aspects(aspect):
+    with pytest.raises(ValueError):
+        AspectProfile([aspect])
+
+
+@pytest.mark.parametrize("profile", [
+    {"aspects": [{"name": "X", "angle": 60, "orb": 1}], "orb_factors": {"Sun": "2"}},
+    {"aspects": [{"name": "X", "angle": 60, "orb": 1}], "orb_factors": {"Sun": 0}},
+    {"aspects": [{"name": "X", "angle": 60, "orb": 1}, {"name": "X", "angle": 90, "orb": 1}]},
+    {"aspects": 5},
+    [1]
+])
+def test_invalid_profiles(profile):
+    with pytest.raises(ValueError):
+        AspectProfile.from_dict(profile)
+
+
+def test_profile_round_trip():
+    profile = AspectProfile.from_dict(DEFAULT_PROFILE.with_orbs({"Trine": 3}).to_dict())
+    assert profile.fingerprint == DEFAULT_PROFILE.with_orbs({"Trine": 3}).fingerprint
+    assert profile.fingerprint != DEFAULT_PROFILE.fingerprint
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import random
+import xml.etree.ElementTree as ElementTree
+
+import numpy as np
+import pytest
+import engine
+import render
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def circular_gaps(angles):
+    ordered = np.sort(np.asarray(angles) % 360)
+    return np.diff(np.append(ordered, ordered[0] + 360))
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"enabled_aspects": tuple(render.ASPECT_SYMBOLS), "midpoint": True}
+])
+def test_svg_is_valid_xml(kwargs):
+    data = engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0, midpoint_from=("Sun",), midpoint_to=("Moon", "Mars"))
+    root = ElementTree.fromstring(render.svg(data, **kwargs))
+    assert root.tag == SVG + "svg"
+    assert (root.get("width"), root.get("height")) == (str(render.WIDTH), str(render.HEIGHT))
+    for tag in ("circle", "line", "path", "text"):
+        assert root.findall(SVG + tag)
+    texts = "".join("".join(i.itertext()) for i in root.iter(SVG + "text"))
+    assert "Date:" in texts and "17.5.1990" in texts
+
+
+def test_spread_keeps_glyphs_apart():
+    random.seed(5)
+    for _ in range(200):
+        angles = [random.uniform(0, 360) for _ in range(random.randint(2, 16))]
+        if random.random() < 0.5:
+            angles = [random.gauss(10, 8) for _ in angles]
+        placed = render.spread(angles, 6.0)
+        assert circular_gaps(placed).min() >= min(6.0, 360 / len(angles)) - 1e-9
+
+
+def test_spread_leaves_separate_glyphs():
+    angles = [10.0, 100.0, 200.0, 359.0]
+    assert render.spread(angles, 6.0) == pytest.approx(angles)
+    assert render.spread([358.0, 2.0], 6.0) == pytest.approx([357.0, 3.0])
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+import swisseph as swe
+import engine
+import returns
+
+
+@pytest.fixture(scope="module")
+def chart():
+    return engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0)
+
+
+def test_solar_returns(chart):
+    jd = chart.jd
+    for found in returns.solar_returns(chart, 20):
+        jd = swe.solcross_ut(chart.degrees["Sun"], jd + 1, swe.FLG_SWIEPH)
+        assert found == pytest.approx(jd, abs=1e-6)
+
+
+def test_lunar_returns(chart):
+    jd = chart.jd
+    for found in returns.lunar_returns(chart, 50):
+        jd = swe.mooncross_ut(chart.degrees["Moon"], jd + 1e-3, swe.FLG_SWIEPH)
+        assert found == pytest.approx(jd, abs=1e-6)
+
+
+@pytest.mark.parametrize("body", ["Mercury", "Mars", "Saturn", "North Node"])
+def test_planet_returns(chart, body):
+    found = returns.returns(chart, body, jd_end=chart.jd + 11000)
+    assert found == sorted(found)
+    for jd in found:
+        longitude = engine.calc_ut(jd, engine.PLANETS[body])[0]
+        assert abs((longitude - chart.degrees[body] + 180) % 360 - 180) < 1e-6
+
+
+def test_return_chart(chart):
+    jd = returns.solar_returns(chart, 1)[0]
+    frame = returns.return_chart(chart, jd, latitude=40.7128, longitude=-74.006)
+    assert frame.jd == jd
+    assert frame.zone == "America/New_York"
+    assert frame.records["Sun"].longitude == pytest.approx(chart.degrees["Sun"], abs=1e-6)
+
+
+def test_unknown_body(chart):
+    with pytest.raises(ValueError):
+        returns.returns(chart, "Vulcan", count=1)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import json
+
+import pytest
+import server
+
+VALUES = {"year": "1990", "month": "5", "day": "17", "hour": "14", "minute": "30", "latitude": "41", "longitude": "29"}
+
+
+def test_parse_params():
+    params = server.parse_params(dict(VALUES, orbs="Square:2, Trine:3", aspects="Square,Trine", dst="1"))
+    assert (params["year"], params["latitude"], params["dst"]) == (1990, 41.0, True)
+    assert params["orbs"] == {"Square": 2.0, "Trine": 3.0}
+    assert params["aspects"] == ["Square", "Trine"]
+    assert server.parse_params(dict(VALUES, orbs={"Square": 2}))["orbs"] == {"Square": 2.0}
+
+
+@pytest.mark.parametrize("values", [
+    dict(VALUES, orbs=[2, 3]),
+    dict(VALUES, orbs=5),
+    dict(VALUES, orbs="Square"),
+    dict(VALUES, orbs="Square:2,Trine"),
+    dict(VALUES, orbs="Square:x"),
+    dict(VALUES, house_system="PP"),
+    dict(VALUES, house_system=["P"]),
+    dict(VALUES, format="gif"),
+    dict(VALUES, day="x")
+])
+def test_parse_params_errors(values):
+    with pytest.raises(ValueError):
+        server.parse_params(values)
+
+
+def test_orbs_type_message():
+    with pytest.raises(ValueError, match="orbs must be an object or 'name:orb,...' string"):
+        server.orbs([2, 3])
+
+
+def test_missing_field():
+    values = dict(VALUES)
+    del values["minute"]
+    with pytest.raises(KeyError):
+        server.parse_params(values)
+
+
+@pytest.mark.parametrize("method, target, body, status", [
+    ("POST", "/chart", json.dumps(dict(VALUES, orbs=[2, 3])).encode(), 400),
+    ("GET", "/chart?year=1990&month=5&day=17&hour=14&minute=30&latitude=41&longitude=29&orbs=Square", b"", 400),
+    ("GET", "/chart?year=1990", b"", 400),
+    ("POST", "/chart", b"[1, 2]", 400),
+    ("PUT", "/chart", b"", 405),
+    ("GET", "/nope", b"", 404)
+])
+def test_respond_errors(method, target, body, status):
+    response = asyncio.run(server.ChartServer().respond(method, target, body))
+    assert response[0] == status
+    assert response[1] == "application/json"
+    assert "error" in json.loads(response[2])
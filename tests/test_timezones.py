@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+import batch
+import engine
+import timezones
+
+CITIES = [
+    ("Kansas City", 39.0997, -94.5786, "America/Chicago", -5.0),
+    ("St Louis", 38.627, -90.1994, "America/Chicago", -5.0),
+    ("Nashville", 36.1627, -86.7816, "America/Chicago", -5.0),
+    ("Oklahoma City", 35.4676, -97.5164, "America/Chicago", -5.0),
+    ("Reno", 39.5296, -119.8138, "America/Los_Angeles", -7.0),
+    ("Pune", 18.5204, 73.8567, "Asia/Kolkata", 5.5),
+    ("Lhasa", 29.652, 91.1721, "Asia/Shanghai", 8.0),
+    ("Kashgar", 39.4704, 75.9898, "Asia/Shanghai", 8.0),
+    ("Vigo", 42.2406, -8.7207, "Europe/Madrid", 2.0)
+]
+
+
+@pytest.mark.parametrize("name, latitude, longitude, zone, offset", CITIES)
+def test_city_zones(name, latitude, longitude, zone, offset):
+    assert timezones.utc_offset(2020, 7, 1, 12, 0, latitude, longitude) == (zone, offset)
+
+
+def test_zones_at():
+    latitudes = [city[1] for city in CITIES] + [95.0]
+    longitudes = [city[2] for city in CITIES] + [0.0]
+    zones = timezones.zones_at(latitudes, longitudes)
+    assert list(zones) == [city[3] for city in CITIES] + [None]
+
+
+def test_skipped_hour():
+    # Clocks in New York went from 02:00 to 03:00 on 2020-03-08.
+    assert timezones.utc_offset(2020, 3, 8, 2, 30, 40.7, -74.0, "America/New_York") == ("America/New_York", -5.0)
+    assert timezones.utc_offset(2020, 3, 8, 2, 30, 40.7, -74.0, "America/New_York", dst=True) == \
+        ("America/New_York", -4.0)
+    assert timezones.utc_offset(2020, 3, 8, 3, 30, 40.7, -74.0, "America/New_York")[1] == -4.0
+
+
+def test_repeated_hour():
+    # Clocks in New York went from 02:00 back to 01:00 on 2020-11-01.
+    assert timezones.utc_offset(2020, 11, 1, 1, 30, 40.7, -74.0, "America/New_York") == ("America/New_York", -5.0)
+    assert timezones.utc_offset(2020, 11, 1, 1, 30, 40.7, -74.0, "America/New_York", dst=True) == \
+        ("America/New_York", -4.0)
+    assert timezones.utc_offset(2020, 11, 1, 0, 30, 40.7, -74.0, "America/New_York")[1] == -4.0
+
+
+def test_local_mean_time():
+    assert timezones.utc_offset(1850, 1, 1, 12, 0, 41.0, 29.0, "Europe/Istanbul")[1] == pytest.approx(29.0 / 15)
+
+
+def test_unknown_zone():
+    with pytest.raises(ValueError):
+        timezones.utc_offset(2020, 7, 1, 12, 0, 41.0, 29.0, "Nowhere/Nothing")
+
+
+def test_shifted_keeps_utc():
+    chart = engine.ChartData(2020, 3, 8, 1, 30, -74.0, 40.7, zone="America/New_York")
+    frame = chart.shifted(1 / 24)
+    assert (frame.hour, frame.minute, frame.utc_offset) == (3, 30, -4.0)
+    assert frame.jd == pytest.approx(chart.jd + 1 / 24)
+
+
+def test_structured_zones():
+    dtype = [(i, int) for i in batch.FIELDS[:5]] + [("latitude", float), ("longitude", float), ("zone", "S16")]
+    records = np.array([
+        (1990, 5, 17, 14, 30, 41.0, 29.0, b"Europe/Istanbul"),
+        (1990, 5, 17, 14, 30, 41.0, 29.0, b""),
+        (1990, 5, 17, 14, 30, 41.0, 29.0, b"Nowhere/Nothing")
+    ], dtype=dtype)
+    result = batch.compute_batch(records)
+    assert result.jd[0] == result.jd[1]
+    assert np.isnan(result.jd[2])
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+from collections import Counter
+
+import pytest
+import swisseph as swe
+import engine
+import transits
+from aspects import aspect_points
+
+
+@pytest.fixture(scope="module")
+def found():
+    chart = engine.ChartData(1990, 5, 17, 14, 30, 29.0, 41.0)
+    return chart, transits.find_transits(chart, swe.julday(2020, 1, 1, 0), swe.julday(2021, 1, 1, 0))
+
+
+def test_no_duplicates(found):
+    chart, events = found
+    assert events
+    assert max(Counter((round(i.jd, 5),) + tuple(i[1:]) for i in events).values()) == 1
+
+
+def test_exact_events(found):
+    chart, events = found
+    angles = dict(zip(chart.profile.names, chart.profile.angles))
+    for event in events:
+        if event.event != "exact":
+            continue
+        longitude = engine.calc_ut(event.jd, engine.PLANETS[event.body])[0]
+        separation = abs((longitude - chart.degrees[event.point] + 180) % 360 - 180)
+        assert separation == pytest.approx(angles[event.aspect], abs=1e-5)
+
+
+def test_orb_events_pair_up(found):
+    chart, events = found
+    counts = Counter((i.body, i.aspect, i.point, i.event) for i in events)
+    for body, aspect, point, event in counts:
+        if event == "enter":
+            assert abs(counts[body, aspect, point, "enter"] - counts[body, aspect, point, "exit"]) <= 1
+
+
+
+@pytest.mark.parametrize("angle, count", [(0, 1), (180, 1), (180.00000000000003, 1), (90, 2)])
+def test_aspect_points(angle, count):
+    assert len(aspect_points(123.4, angle)) == count
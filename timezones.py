@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from datetime import MAXYEAR, MINYEAR, datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+# tzdb gives Xinjiang the unofficial local time; the official time there is Beijing time.
+OFFICIAL_ZONES = {"Asia/Urumqi": "Asia/Shanghai"}
+
+_finder = None
+
+
+def zone_finder():
+    global _finder
+    if _finder is None:
+        try:
+            from timezonefinder import TimezoneFinder
+        except ImportError:
+            raise ImportError("Looking up the time zone of a location needs the timezonefinder package; "
+                              "install it or pass zone")
+        _finder = TimezoneFinder()
+    return _finder
+
+
+@lru_cache(maxsize=65536)
+def zone_at(latitude, longitude):
+    zone = zone_finder().timezone_at(lat=float(latitude), lng=float(longitude))
+    if zone is None:
+        raise ValueError(f"No time zone at {latitude}, {longitude}")
+    return OFFICIAL_ZONES.get(zone, zone)
+
+
+def lookup(latitude, longitude):
+    try:
+        return zone_at(latitude, longitude)
+    except ValueError:
+        return None
+
+
+def zones_at(latitudes, longitudes):
+    points = np.column_stack([np.ravel(latitudes), np.ravel(longitudes)]).astype(np.float64)
+    unique, inverse = np.unique(points, axis=0, return_inverse=True)
+    # Locations without a zone stay None and fail on their own row.
+    zones = np.array([lookup(latitude, longitude) for latitude, longitude in unique.tolist()], dtype=object)
+    return zones[inverse.ravel()].reshape(np.shape(latitudes))
+
+
+@lru_cache(maxsize=None)
+def get_zone(name):
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, TypeError, ValueError):
+        raise ValueError(f"Unknown time zone: {name}")
+
+
+def offset_hours(moment):
+    if moment.tzname() == "LMT":
+        return None
+    return moment.utcoffset().total_seconds() / 3600
+
+
+@lru_cache(maxsize=65536)
+def day_offsets(zone, year, month, day):
+    start = datetime(year, month, day, tzinfo=get_zone(zone))
+    return offset_hours(start), offset_hours(start + timedelta(days=1))
+
+
+def utc_offset(year, month, day, hour, minute, latitude, longitude, zone=None, dst=False):
+    if zone is None:
+        zone = zone_at(latitude, longitude)
+    if not MINYEAR <= year < MAXYEAR:
+        return zone, longitude / 15
+    start, end = day_offsets(zone, year, month, day)
+    if start == end:
+        offset = start
+    else:
+        # A transition falls on this day: resolve the wall clock time itself. A repeated hour or
+        # one skipped when clocks go forward is read as daylight saving time only when dst is set.
+        readings = [offset_hours(datetime(year, month, day, hour, minute, tzinfo=get_zone(zone), fold=fold))
+                    for fold in (0, 1)]
+        readings = [i for i in readings if i is not None]
+        offset = (max if dst else min)(readings) if readings else None
+    if offset is None:
+        # Before standard time was adopted, clocks kept the local mean time of the place.
+        offset = longitude / 15
+    return zone, offset
+
+
+def universal_offset(zone, year, month, day, hour, minute, longitude):
+    if not MINYEAR <= year < MAXYEAR:
+        return longitude / 15
+    moment = datetime(year, month, day, hour, minute, tzinfo=timezone.utc).astimezone(get_zone(zone))
+    offset = offset_hours(moment)
+    if offset is None:
+        return longitude / 15
+    return offset
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+import numpy as np
+import swisseph as swe
+import engine
+from aspects import DEFAULT_PROFILE, aspect_points
+
+Transit = namedtuple("Transit", ["jd", "body", "aspect", "point", "event"])
+
+STEP_DEGREES = 30.0
+MAX_STEP = 5.0
+MAX_STEPS = {swe.TRUE_NODE: 1.0}
+TOLERANCE = 1e-7
+
+
+def wrap(angle):
+    return (angle + 180) % 360 - 180
+
+
+def position(jd, planet):
+    xx = engine.calc_ut(jd, planet)
+    return xx[0], xx[3]
+
+
+def find_station(planet, t0, v0, t1, tolerance=TOLERANCE):
+    while t1 - t0 > tolerance:
+        t = (t0 + t1) / 2
+        v = position(t, planet)[1]
+        if (v > 0) == (v0 > 0):
+            t0, v0 = t, v
+        else:
+            t1 = t
+    return (t0 + t1) / 2
+
+
+def refine(planet, target, t0, g0, t1, g1, tolerance=TOLERANCE):
+    t = t0 + (t1 - t0) * g0 / (g0 - g1)
+    for _ in range(60):
+        lon, speed = position(t, planet)
+        g = wrap(lon - target)
+        if abs(g) < tolerance or t1 - t0 < tolerance:
+            return t
+        if (g > 0) == (g0 > 0):
+            t0, g0 = t, g
+        else:
+            t1, g1 = t, g
+        if speed != 0 and t0 < t - g / speed < t1:
+            t = t - g / speed
+        else:
+            t = (t0 + t1) / 2
+    return t
+
+
+class TransitSearch:
+    def __init__(self, points, profile=None, planets=None, table=None):
+        engine.ensure_ephe_path()
+        if hasattr(points, "degrees"):
+            points = points.degrees
+        self.points = dict(points)
+        self.profile = profile or DEFAULT_PROFILE
+        self.planets = planets or engine.PLANETS
+        self.table = table
+
+    def targets(self, name):
+        targets = []
+        for point, degree in self.points.items():
+            orb_factor = self.profile.factors([name, point]).max()
+            for aspect, angle, orb in zip(self.profile.names, self.profile.angles, self.profile.orbs):
+                for target in aspect_points(degree, angle):
+                    targets.append((target, orb * orb_factor, aspect, point))
+        return targets
+
+    def pieces(self, planet, jd_start, jd_end):
+        step = MAX_STEPS.get(planet, MAX_STEP)
+        if self.table is not None and planet in self.table:
+            yield from self.table_pieces(planet, jd_start, jd_end, step)
+            return
+        t0 = jd_start
+        lon0, v0 = position(t0, planet)
+        while t0 < jd_end:
+            t1 = min(jd_end, t0 + min(step, STEP_DEGREES / max(abs(v0), 1e-6)))
+            lon1, v1 = position(t1, planet)
+            if (v0 > 0) != (v1 > 0):
+                ts = find_station(planet, t0, v0, t1)
+                lons = position(ts, planet)[0]
+                yield t0, lon0, ts, lons
+                yield ts, lons, t1, lon1
+            else:
+                yield t0, lon0, t1, lon1
+            t0, lon0, v0 = t1, lon1, v1
+
+    def table_pieces(self, planet, jd_start, jd_end, step):
+        jd = np.append(np.arange(jd_start, jd_end, step), jd_end)
+        lon, lat, speed = self.table.lookup(jd, planet)
+        for t0, lon0, v0, t1, lon1, v1 in zip(jd[:-1], lon[:-1], speed[:-1], jd[1:], lon[1:], speed[1:]):
+            if (v0 > 0) != (v1 > 0):
+                ts = find_station(planet, t0, v0, t1)
+                lons = position(ts, planet)[0]
+                yield t0, lon0, ts, lons
+                yield ts, lons, t1, lon1
+            else:
+                yield t0, lon0, t1, lon1
+
+    def search(self, jd_start, jd_end, enter_exit=True):
+        found = []
+        for name, planet in self.planets.items():
+            targets = self.targets(name)
+            degrees = np.array([i[0] for i in targets])
+            orbs = np.array([i[1] for i in targets])
+            levels = [(0.0, "exact")]
+            if enter_exit:
+                levels += [(-1.0, "orb"), (1.0, "orb")]
+            for t0, lon0, t1, lon1 in self.pieces(planet, jd_start, jd_end):
+                for sign, event in levels:
+                    shift = degrees + sign * orbs
+                    g0 = wrap(lon0 - shift)
+                    g1 = wrap(lon1 - shift)
+                    crossing = ((g0 > 0) != (g1 > 0)) & (np.abs(g1 - g0) < 180)
+                    for i in np.nonzero(crossing)[0]:
+                        jd = refine(planet, shift[i], t0, g0[i], t1, g1[i])
+                        if event == "orb":
+                            inward = (g1[i] - g0[i]) * sign < 0
+                            kind = "enter" if inward else "exit"
+                        else:
+                            kind = event
+                        found.append(Transit(jd, name, targets[i][2], targets[i][3], kind))
+        found.sort()
+        return found
+
+
+def find_transits(points, jd_start, jd_end, profile=None, planets=None, enter_exit=True, table=None):
+    return TransitSearch(points, profile=profile, planets=planets, table=table).search(
+        jd_start, jd_end, enter_exit=enter_exit)